@@ -1,9 +1,10 @@
 """The DeWarmte integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta
-from typing import Any, Dict, Optional, List
+from typing import Optional, List
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
@@ -18,13 +19,15 @@ from homeassistant.helpers.update_coordinator import (
 
 from .api.client import DeWarmteApiClient
 from .api.models.config import ConnectionSettings
-from .api.models.device import Device, DwDeviceInfo
-from .api.models.api_sensor import ApiSensor
+from .api.models.device import MANUFACTURER, Device
 from .const import CONF_UPDATE_INTERVAL, DOMAIN, DEFAULT_UPDATE_INTERVAL
 from .api.models.status_data import StatusData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device types that expose operation settings (HC devices have none)
+SETTINGS_DEVICE_TYPES = frozenset({"AO", "MP", "PT"})
+
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
@@ -42,9 +45,6 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up DeWarmte from a config entry."""
     try:
-        # Import platforms here to avoid circular imports
-        from . import sensor, binary_sensor, number, select, switch  # noqa: F401
-
         hass.data.setdefault(DOMAIN, {})
         entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
@@ -118,6 +118,17 @@ class DeWarmteDataUpdateCoordinator(DataUpdateCoordinator[StatusData]):
         )
         self.api = api
         self._device = device
+        # Shared by all entities of the device
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.device_id)},
+            name=device.display_name,
+            manufacturer=MANUFACTURER,
+            model=device.device_type,
+            sw_version="",
+            hw_version="",
+        )
+        # Prefix of every entity unique_id for this device: "<device_id>_"
+        self.unique_id_prefix = f"{device.device_id}_"
 
     @property
     def device(self) -> Optional[Device]:
@@ -127,9 +138,18 @@ class DeWarmteDataUpdateCoordinator(DataUpdateCoordinator[StatusData]):
     async def _async_update_data(self) -> StatusData:
         """Update data via library."""
         try:
-            # First ensure we're logged in by attempting to get status data
-            # This will trigger login if needed
-            status_data = await self.api.async_get_status_data(self.device)
+            # Get operation settings (needed for number, select, and switch entities)
+            # together with the status data.
+            # Fetch settings for AO, MP, and PT devices (HC devices have no settings)
+            if self.device.device_type in SETTINGS_DEVICE_TYPES:
+                status_data, settings = await asyncio.gather(
+                    self.api.async_get_status_data(self.device),
+                    self.api.async_get_operation_settings(self.device),
+                )
+            else:
+                status_data = await self.api.async_get_status_data(self.device)
+                settings = None
+
             if not status_data:
                 raise UpdateFailed("Failed to get status data")
 
@@ -138,12 +158,7 @@ class DeWarmteDataUpdateCoordinator(DataUpdateCoordinator[StatusData]):
                          self.device.device_id if self.device else "unknown", 
                          status_data.thermostat)
 
-            # Get operation settings (needed for number, select, and switch entities)
-            # Fetch settings for AO, MP, and PT devices (HC devices have no settings)
-            if self.device.product_id.startswith(("AO ", "MP ", "PT ")):
-                self._cached_settings = await self.api.async_get_operation_settings(self.device)
-            else:
-                self._cached_settings = None
+            self._cached_settings = settings
 
             return status_data
 
@@ -154,14 +169,4 @@ class DeWarmteDataUpdateCoordinator(DataUpdateCoordinator[StatusData]):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        if not self.device:
-            raise ValueError("Device must be available to get device info")
-            
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device.device_id)},
-            name=self.device.info.name,
-            manufacturer=self.device.info.manufacturer,
-            model=self.device.info.model,
-            sw_version=self.device.info.sw_version,
-            hw_version=self.device.info.hw_version,
-        ) 
\ No newline at end of file
+        return self._device_info 
\ No newline at end of file
@@ -1,10 +1,15 @@
 """Authentication module for DeWarmte."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from datetime import datetime, timedelta, timezone
 
 import aiohttp
+import orjson
+
+from ..const import API_BASE_URL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,6 +17,22 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_TOKEN_LIFETIME = timedelta(minutes=60)
 REFRESH_BUFFER = timedelta(seconds=60)
 
+# The login response also carries user and refresh data we never use, so only
+# the access token is pulled out of the raw body.
+_ACCESS_TOKEN_RE = re.compile(rb'"access"\s*:\s*"([^"\\]+)"')
+
+
+def extract_access_token(body: bytes) -> str | None:
+    """Return the access token from a raw login response body."""
+    if match := _ACCESS_TOKEN_RE.search(body):
+        return match.group(1).decode()
+    # Fall back to a full parse for unexpected layouts (e.g. escaped values).
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+    return data.get("access") if isinstance(data, dict) else None
+
 
 class DeWarmteAuth:
     """Authentication handler for DeWarmte."""
@@ -19,12 +40,17 @@ class DeWarmteAuth:
     def __init__(self, username: str, password: str, session: aiohttp.ClientSession) -> None:
         """Initialize the auth handler."""
         self._username = username
-        self._password = password
-        self._base_url = "https://api.mydewarmte.com/v1"
+        # Credentials never change for this handler: serialize the login body
+        # once and keep that instead of a separate plaintext password field.
+        self._login_body = orjson.dumps({"email": username, "password": password})
+        self._base_url = API_BASE_URL
+        self._login_url = f"{self._base_url}/auth/token/"
         self._session = session
         self._access_token: str | None = None
         self._token_issued_at: datetime | None = None
         self._token_lifetime: timedelta = DEFAULT_TOKEN_LIFETIME
+        # Requests started together (several devices, status and settings) share one login
+        self._login_lock = asyncio.Lock()
 
         self._headers = {
             "Accept": "application/json",
@@ -45,37 +71,47 @@ class DeWarmteAuth:
         if not force and not self.needs_refresh(buffer_seconds=buffer_seconds):
             return True
 
-        try:
-            login_url = f"{self._base_url}/auth/token/"
-            login_data = {
-                "email": self._username,
-                "password": self._password,
-            }
-            _LOGGER.debug("Attempting login with email: %s", self._username)
-            async with self._session.post(login_url, json=login_data, headers=self._headers) as response:
-                if response.status != 200:
-                    _LOGGER.error("Login failed with status %d: %s", response.status, await response.text())
-                    return False
-                data = await response.json()
-                token = data.get("access")
-                if not token:
-                    _LOGGER.error("No access token in response")
-                    return False
-
-                self._access_token = token
-                self._headers["Authorization"] = f"Bearer {token}"
-                self._token_issued_at = datetime.now(timezone.utc)
-                _LOGGER.debug("Successfully obtained access token")
+        async with self._login_lock:
+            # Another caller may have logged in while we waited for the lock
+            if not force and not self.needs_refresh(buffer_seconds=buffer_seconds):
                 return True
+            return await self._login()
 
-        except Exception as err:
-            _LOGGER.error("Error during login: %s", str(err))
-            _LOGGER.error("Error type: %s", type(err).__name__)
-            import traceback
+    async def async_login(self) -> bool:
+        """Log in now, raising connection errors instead of returning False.
 
-            _LOGGER.error("Traceback: %s", traceback.format_exc())
+        Returns False only when the API rejects the credentials.
+        """
+        async with self._login_lock:
+            return await self._post_login()
+
+    async def _login(self) -> bool:
+        """Log in and store the new access token."""
+        try:
+            return await self._post_login()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            _LOGGER.exception("Error during login")
             return False
 
+    async def _post_login(self) -> bool:
+        """Send the login request and store the new access token."""
+        _LOGGER.debug("Attempting login with email: %s", self._username)
+        # Content-Type: application/json is part of self._headers
+        async with self._session.post(self._login_url, data=self._login_body, headers=self._headers) as response:
+            if response.status != 200:
+                _LOGGER.error("Login failed with status %d: %s", response.status, await response.text())
+                return False
+            token = extract_access_token(await response.read())
+            if not token:
+                _LOGGER.error("No access token in response")
+                return False
+
+            self._access_token = token
+            self._headers["Authorization"] = f"Bearer {token}"
+            self._token_issued_at = datetime.now(timezone.utc)
+            _LOGGER.debug("Successfully obtained access token")
+            return True
+
     def needs_refresh(self, buffer_seconds: int | None = None) -> bool:
         """Determine whether the token should be refreshed."""
         if self._access_token is None or self._token_issued_at is None:
@@ -1,30 +1,105 @@
 """API client for DeWarmte v1."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, Union, Callable, List
+import time
+from typing import Any, Dict, Union
 
 import aiohttp
+import orjson
 
 from .models.device import Device
-from .models.api_sensor import ApiSensor
 from .models.config import ConnectionSettings
-from .models.settings import DeviceOperationSettings, SettingsGroup, SETTING_GROUPS
+from .models.settings import (
+    DeviceOperationSettings,
+    SettingsGroup,
+    SETTING_GROUP_BY_KEY,
+    SETTING_GROUPS,
+    WarmWaterRange,
+)
 from .auth import DeWarmteAuth
+from ..const import API_BASE_URL
 from .models.status_data import StatusData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Transport failures; handled (logged and turned into None) in _request_with_retry
+_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+# Unexpected payload shapes while building models from a response; AttributeError
+# covers valid JSON that is not an object (e.g. an error list)
+_PARSE_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+# Upper bound on requests in flight, so polls pile up in the client instead of
+# in the connection pool when the API is slow
+_MAX_CONCURRENT_REQUESTS = 5
+# Back-off after a 429 that carries no usable Retry-After header, in seconds
+_DEFAULT_RETRY_AFTER = 60.0
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body, returning None if it is not valid JSON."""
+    # Decoding the raw bytes directly skips aiohttp's content-type and charset
+    # detection; the API always answers with UTF-8 JSON.
+    try:
+        return orjson.loads(await response.read())
+    except orjson.JSONDecodeError:
+        return None
+
+
 class DeWarmteApiClient:
     """API client for DeWarmte v1."""
 
     def __init__(self, connection_settings: ConnectionSettings, session: aiohttp.ClientSession) -> None:
         """Initialize the API client."""
+        # The client never creates a session of its own; Home Assistant's shared
+        # session keeps the connections opened during login warm for polling
+        assert session is not None, "An aiohttp session must be provided"
         self._settings = connection_settings
         self._session = session
-        self._base_url = "https://api.mydewarmte.com/v1"
+        self._base_url = API_BASE_URL
         self._auth = DeWarmteAuth(connection_settings.username, connection_settings.password, session)
 
+        # Endpoint URLs are fixed for the client's lifetime; build them once
+        self._products_url = f"{self._base_url}/customer/products/"
+        self._tb_status_url = f"{self._base_url}/customer/products/tb-status/"
+        self._settings_urls: dict[str, str] = {}
+        # ETag and decoded body of the last successful GET per URL
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        self._request_slots = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        # Monotonic time until which the API asked us not to send requests
+        self._rate_limited_until = 0.0
+
+    @property
+    def settings(self) -> ConnectionSettings:
+        """Get the connection settings the client was created with."""
+        return self._settings
+
+    def settings_url(self, device: Device) -> str:
+        """Return the settings URL for a device."""
+        url = self._settings_urls.get(device.device_id)
+        if url is None:
+            url = f"{self._products_url}{device.device_id}/settings/"
+            self._settings_urls[device.device_id] = url
+        return url
+
+    async def async_validate_credentials(self) -> bool:
+        """Log in with the configured credentials.
+
+        Returns False when the credentials are rejected; connection errors are
+        raised so callers can tell the two apart.
+        """
+        return await self._auth.async_login()
+
+    def _set_rate_limited(self, response: aiohttp.ClientResponse) -> None:
+        """Pause requests for as long as a 429 response asks."""
+        try:
+            delay = float(response.headers.get("Retry-After", _DEFAULT_RETRY_AFTER))
+        except ValueError:
+            # Retry-After may also be an HTTP date; not worth parsing here
+            delay = _DEFAULT_RETRY_AFTER
+        self._rate_limited_until = time.monotonic() + delay
+        _LOGGER.warning("API rate limit reached; pausing requests for %.0f seconds", delay)
+
     #TODO: Is this the best way to handle retries? Or should we use aiohttp's built in retry functionality?
     async def _request_with_retry(
         self,
@@ -45,6 +120,10 @@ class DeWarmteApiClient:
             Tuple of (status_code, json_data) on success, None on failure.
             json_data will be None if response is not JSON or on error.
         """
+        if time.monotonic() < self._rate_limited_until:
+            _LOGGER.debug("Skipping %s %s while rate limited", method, url)
+            return None
+
         if not await self._auth.ensure_token():
             _LOGGER.error("Cannot perform %s %s without valid login", method, url)
             return None
@@ -52,39 +131,59 @@ class DeWarmteApiClient:
         try:
             # Get the appropriate method from session
             request_method = getattr(self._session, method.lower())
-            async with request_method(url, headers=self._auth.headers, **kwargs) as response:
+            async with self._request_slots, request_method(
+                url, headers=self._request_headers(method, url), **kwargs
+            ) as response:
                 if response.status == 401 and retry:
                     _LOGGER.debug("%s %s returned 401; refreshing token and retrying", method, url)
                     self._auth.mark_expired()
                     if not await self._auth.ensure_token(force=True):
                         return None
                     # Retry the request
-                    async with request_method(url, headers=self._auth.headers, **kwargs) as retry_response:
-                        if retry_response.status != 200:
+                    async with request_method(url, headers=self._request_headers(method, url), **kwargs) as retry_response:
+                        if retry_response.status not in (200, 304):
                             _LOGGER.error("Failed to %s %s after retry: %d", method, url, retry_response.status)
+                            if retry_response.status == 429:
+                                self._set_rate_limited(retry_response)
                             return None
                         # Read JSON inside context before it closes
-                        try:
-                            json_data = await retry_response.json()
-                        except Exception:
-                            json_data = None
-                        return (retry_response.status, json_data)
+                        return await self._read_response(method, url, retry_response)
 
-                if response.status != 200:
+                if response.status not in (200, 304):
                     _LOGGER.error("Failed to %s %s: %d", method, url, response.status)
                     if response.status == 401:
                         self._auth.mark_expired()
+                    elif response.status == 429:
+                        self._set_rate_limited(response)
                     return None
                 # Read JSON inside context before it closes
-                try:
-                    json_data = await response.json()
-                except Exception:
-                    json_data = None
-                return (response.status, json_data)
-        except Exception as err:
+                return await self._read_response(method, url, response)
+        except _REQUEST_ERRORS as err:
             _LOGGER.error("Error performing %s %s: %s", method, url, err)
             return None
 
+    def _request_headers(self, method: str, url: str) -> dict[str, str]:
+        """Return the request headers, making GETs conditional when an ETag is known."""
+        headers = self._auth.headers
+        if method == "GET" and (cached := self._etag_cache.get(url)) is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+        return headers
+
+    async def _read_response(
+        self, method: str, url: str, response: aiohttp.ClientResponse
+    ) -> tuple[int, Any]:
+        """Return status and JSON body, reusing the cached body on 304 Not Modified."""
+        if response.status == 304 and (cached := self._etag_cache.get(url)) is not None:
+            return (response.status, cached[1])
+
+        data = await _read_json(response)
+        if method == "GET":
+            if (etag := response.headers.get("ETag")) is not None:
+                self._etag_cache[url] = (etag, data)
+            else:
+                self._etag_cache.pop(url, None)
+        return (response.status, data)
+
     async def _get_with_retry(self, url: str, retry: bool = True) -> Dict[str, Any] | None:
         """Perform GET request with optional retry on unauthorized."""
         result = await self._request_with_retry("GET", url, retry=retry)
@@ -93,13 +192,20 @@ class DeWarmteApiClient:
         _status, json_data = result
         return json_data
 
+    async def _post_json(self, url: str, payload: Any) -> tuple[int, Dict[str, Any] | None] | None:
+        """POST a JSON payload, encoded with orjson.
+
+        The auth headers already declare a JSON content type, so the body is
+        sent as pre-encoded bytes instead of through aiohttp's json.dumps.
+        """
+        return await self._request_with_retry("POST", url, data=orjson.dumps(payload))
+
     async def async_discover_devices(self) -> list[Device]:
         """Discover all supported devices from the API."""
         try:
             # Get device info
-            products_url = f"{self._base_url}/customer/products/"
-            _LOGGER.debug("Making GET request to %s", products_url)
-            response = await self._get_with_retry(products_url)
+            _LOGGER.debug("Making GET request to %s", self._products_url)
+            response = await self._get_with_retry(self._products_url)
             if response is None:
                 return []
             
@@ -114,7 +220,7 @@ class DeWarmteApiClient:
                     continue
                 product_type = product.get("type", "unknown")
                 #TODO: Device handling is overly complex. Important: keep entity ID generation backward compatible.
-                device = Device.from_api_response(
+                device = Device(
                     device_id=device_id,
                     product_id=f"{product_type} {product.get('name', '')}",
                     access_token=self._auth.access_token,  # Get token from auth object
@@ -124,11 +230,12 @@ class DeWarmteApiClient:
                 )
                 devices.append(device)
 
-            _LOGGER.debug("Discovered devices: %s", [d.device_id for d in devices])
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Discovered devices: %s", [d.device_id for d in devices])
             return devices
 
-        except Exception as err:
-            _LOGGER.error("Error getting device info: %s", str(err))
+        except _PARSE_ERRORS as err:
+            _LOGGER.error("Error getting device info: %s", err)
             return []
 
     async def async_get_status_data(self, device: Device) -> StatusData | None:
@@ -139,10 +246,12 @@ class DeWarmteApiClient:
             if not await self._auth.ensure_token():
                 return None
 
-            # Get main status data
-            products_url = f"{self._base_url}/customer/products/"
-            _LOGGER.debug("Making GET request to %s", products_url)
-            response = await self._get_with_retry(products_url)
+            # The products list and tb-status are independent; fetch both at once
+            _LOGGER.debug("Making GET requests to %s and %s", self._products_url, self._tb_status_url)
+            response, tb_response = await asyncio.gather(
+                self._get_with_retry(self._products_url),
+                self._get_with_retry(self._tb_status_url),
+            )
             if response is None:
                 return None
 
@@ -150,38 +259,36 @@ class DeWarmteApiClient:
             _LOGGER.debug("Products data: %s", data)
 
             # Find our device in the results
-            for product in data.get("results", []):
-                if product.get("id") == device.device_id:
-                    # Create StatusData from the product data
-                    status_data = StatusData.from_dict({**product, **product.get("status", {})})
-
-                    # Get outdoor temperature from tb-status endpoint
-                    tb_status_url = f"{self._base_url}/customer/products/tb-status/"
-                    _LOGGER.debug("Making GET request to %s", tb_status_url)
-                    tb_response = await self._get_with_retry(tb_status_url)
-                    if tb_response is not None:
-                        _LOGGER.debug("Status data: %s", tb_response)
-                        status_data.update_from_dict(tb_response)
-
-                    if status_data.invalid_fields:
-                        _LOGGER.debug(
-                            "Device %s returned missing/invalid status fields: %s",
-                            device.device_id,
-                            ", ".join(status_data.invalid_fields),
-                        )
-
-                    return status_data
-
-            _LOGGER.error("Device %s not found in products response", device.device_id)
-            return None
-        except Exception as err:
-            _LOGGER.error("Error getting status data: %s", str(err))
+            products_by_id = {product.get("id"): product for product in data.get("results", ())}
+            product = products_by_id.get(device.device_id)
+            if product is None:
+                _LOGGER.error("Device %s not found in products response", device.device_id)
+                return None
+
+            # Create StatusData from the product data
+            status_data = StatusData.from_dict({**product, **product.get("status", {})})
+
+            # Outdoor temperature comes from the tb-status endpoint
+            if tb_response is not None:
+                _LOGGER.debug("Status data: %s", tb_response)
+                status_data.update_from_dict(tb_response)
+
+            if status_data.invalid_fields and _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Device %s returned missing/invalid status fields: %s",
+                    device.device_id,
+                    ", ".join(status_data.invalid_fields),
+                )
+
+            return status_data
+        except _PARSE_ERRORS as err:
+            _LOGGER.error("Error getting status data: %s", err)
             return None
 
     async def async_get_operation_settings(self, device: Device) -> DeviceOperationSettings | None:
         """Get operation settings from the API for a specific device."""
         try:
-            settings_url = f"{self._base_url}/customer/products/{device.device_id}/settings/"
+            settings_url = self.settings_url(device)
             _LOGGER.debug("Making GET request to %s", settings_url)
             response = await self._get_with_retry(settings_url)
             if response is None:
@@ -192,8 +299,8 @@ class DeWarmteApiClient:
             settings = DeviceOperationSettings.from_api_response(data)
             return settings
                 
-        except Exception as err:
-            _LOGGER.error("Error getting operation settings: %s", str(err))
+        except _PARSE_ERRORS as err:
+            _LOGGER.error("Error getting operation settings: %s", err)
             return None
 
     async def async_update_operation_settings(self, device: Device, key: str, value: Union[float, str, int, bool]) -> None:
@@ -201,20 +308,32 @@ class DeWarmteApiClient:
         _LOGGER.debug("Updating operation setting %s to %s", key, value)
 
         # Find which group this setting belongs to
-        for group in SETTING_GROUPS.values():
-            if key in group.keys:
-                _LOGGER.debug("Found setting group %s for key %s", group.endpoint, key)
-                await self._update_settings(device, group, key, value)
-                return
+        group = SETTING_GROUP_BY_KEY.get(key)
+        if group is None:
+            raise ValueError(
+                f"Unable to change setting {key}. "
+                "Please report this as a bug."
+            )
+
+        _LOGGER.debug("Found setting group %s for key %s", group.endpoint, key)
+        await self._update_settings(device, group, key, value)
+
+    async def async_update_warm_water_ranges(self, device: Device, ranges: list[WarmWaterRange]) -> None:
+        """Enable scheduled warm water for a device and replace its ranges."""
+        url = f"{self.settings_url(device)}{SETTING_GROUPS['warm_water'].endpoint}/"
+        update_data = {
+            "warm_water_is_scheduled": True,
+            "warm_water_ranges": [range_obj.as_dict() for range_obj in ranges],
+        }
 
-        raise ValueError(
-            f"Unable to change setting {key}. "
-            "Please report this as a bug."
-        )
+        # A single POST both enables scheduled mode and replaces the ranges
+        _LOGGER.debug("Making POST request to %s with data: %s", url, update_data)
+        if await self._post_json(url, update_data) is None:
+            raise ValueError("Failed to update warm water ranges")
 
     async def _update_settings(self, device: Device, group: SettingsGroup, key: str, value: Any) -> None:
         """Common logic for updating settings for a specific device."""
-        url = f"{self._base_url}/customer/products/{device.device_id}/settings/{group.endpoint}/"
+        url = f"{self.settings_url(device)}{group.endpoint}/"
         
         # Get current settings
         current_settings = await self.async_get_operation_settings(device)
@@ -237,7 +356,7 @@ class DeWarmteApiClient:
             
             if thermostat_type == "heating_only" and control_mode == "thermostat":
                 update_settings["cooling_control_mode"] = "heating_only"
-            elif thermostat_type == "heating_and_cooling" and control_mode in ["cooling_only", "heating_only"]:
+            elif thermostat_type == "heating_and_cooling" and control_mode in {"cooling_only", "heating_only"}:
                 update_settings["cooling_control_mode"] = "thermostat"
         
         # Handle warm water target temperature - set scheduled=false and create single range
@@ -259,13 +378,13 @@ class DeWarmteApiClient:
         
         _LOGGER.debug("Making POST request to %s with data: %s", url, update_settings)
         try:
-            result = await self._request_with_retry("POST", url, json=update_settings)
+            result = await self._post_json(url, update_settings)
             if result is None:
                 raise ValueError(f"Failed to update {group.endpoint} settings")
             
             _status, response_data = result
             if response_data is not None:
                 _LOGGER.debug("%s settings update response: %s", group.endpoint, response_data)
-        except Exception as err:
-            _LOGGER.error("Error updating %s settings: %s", group.endpoint, str(err))
+        except ValueError as err:
+            _LOGGER.error("Error updating %s settings: %s", group.endpoint, err)
             raise 
\ No newline at end of file
@@ -1,6 +1,6 @@
 """API data models."""
 
-from .device import Device, DwDeviceInfo
+from .device import Device
 from .api_sensor import ApiSensor
 from .config import ConnectionSettings
 from .settings import (
@@ -9,7 +9,6 @@ from .settings import (
 
 __all__ = [
     "Device",
-    "DwDeviceInfo",
     "ApiSensor",
     "ConnectionSettings",
     "DeviceOperationSettings",
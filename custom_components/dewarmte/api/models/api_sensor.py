@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-@dataclass
+@dataclass(slots=True)
 class ApiSensor:
     """Basic representation of a sensor from the API."""
     key: str
@@ -1,9 +1,9 @@
 """Application configuration models for DeWarmte API."""
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionSettings:
     """Connection settings for DeWarmte API."""
     username: str
     password: str
-    update_interval: int 
\ No newline at end of file
+    update_interval: int
@@ -1,23 +1,36 @@
 """Settings models for DeWarmte API."""
+import sys
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, NamedTuple, Tuple
 
-@dataclass
-class SettingsGroup:
+def _intern_option(value: Any) -> Any:
+    """Intern a mode string so repeated polls hand out the same object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+class SettingsGroup(NamedTuple):
     """Represents a group of related settings that are updated together."""
     endpoint: str
-    keys: List[str]
+    keys: Tuple[str, ...]
 
-@dataclass
+@dataclass(slots=True)
 class WarmWaterRange:
     """Represents a warm water temperature range with time period."""
     order: int
     temperature: float
     period: str  # Format: "HH:MM-HH:MM"
 
-@dataclass
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the range in the format the API expects."""
+        return {"order": self.order, "temperature": self.temperature, "period": self.period}
+
+@dataclass(slots=True)
 class DeviceOperationSettings:
-    """Device operation settings."""
+    """Device operation settings.
+
+    from_api_response coerces every numeric field to its annotated type, so
+    entities can report these values without converting them again.
+    """
     # Heat curve settings
     heat_curve_mode: str
     heating_kind: str
@@ -53,8 +66,8 @@ class DeviceOperationSettings:
 
         return cls(
             # Heat curve settings
-            heat_curve_mode=data["heat_curve_mode"],
-            heating_kind=data["heating_kind"],
+            heat_curve_mode=_intern_option(data["heat_curve_mode"]),
+            heating_kind=_intern_option(data["heating_kind"]),
             heat_curve_s1_outside_temp=float(data["heat_curve_s1_outside_temp"]),
             heat_curve_s1_target_temp=float(data["heat_curve_s1_target_temp"]),
             heat_curve_s2_outside_temp=float(data["heat_curve_s2_outside_temp"]),
@@ -64,17 +77,17 @@ class DeviceOperationSettings:
 
             # Other settings
             advanced_boost_mode_control=bool(data["advanced_boost_mode_control"]),
-            advanced_thermostat_delay=data["advanced_thermostat_delay"],
-            backup_heating_mode=data["backup_heating_mode"],
-            cooling_thermostat_type=data["cooling_thermostat_type"],
+            advanced_thermostat_delay=_intern_option(data["advanced_thermostat_delay"]),
+            backup_heating_mode=_intern_option(data["backup_heating_mode"]),
+            cooling_thermostat_type=_intern_option(data["cooling_thermostat_type"]),
             cooling_temperature=float(data["cooling_temperature"]),
-            cooling_control_mode=data["cooling_control_mode"],
+            cooling_control_mode=_intern_option(data["cooling_control_mode"]),
             cooling_duration=int(data["cooling_duration"]),
-            heating_performance_mode=data["heating_performance_mode"],
+            heating_performance_mode=_intern_option(data["heating_performance_mode"]),
             heating_performance_backup_temperature=float(data["heating_performance_backup_temperature"]),
-            sound_mode=data["sound_mode"],
-            sound_compressor_power=data["sound_compressor_power"],
-            sound_fan_speed=data["sound_fan_speed"],
+            sound_mode=_intern_option(data["sound_mode"]),
+            sound_compressor_power=_intern_option(data["sound_compressor_power"]),
+            sound_fan_speed=_intern_option(data["sound_fan_speed"]),
             warm_water_is_scheduled=bool(data.get("warm_water_is_scheduled", False)),
             warm_water_target_temperature=float(data["warm_water_ranges"][0]["temperature"]) if data.get("warm_water_ranges") and len(data["warm_water_ranges"]) > 0 else 55.0,
             warm_water_ranges=[
@@ -90,37 +103,45 @@ class DeviceOperationSettings:
         )
 
 # Define all settings groups
-SETTING_GROUPS = {
+SETTING_GROUPS: Mapping[str, SettingsGroup] = MappingProxyType({
     "heat_curve": SettingsGroup(
         endpoint="heat-curve",
-        keys=["heat_curve_mode", "heating_kind", "heat_curve_s1_outside_temp", 
+        keys=("heat_curve_mode", "heating_kind", "heat_curve_s1_outside_temp", 
               "heat_curve_s1_target_temp", "heat_curve_s2_outside_temp", 
               "heat_curve_s2_target_temp", "heat_curve_fixed_temperature", 
-              "heat_curve_use_smart_correction"],
+              "heat_curve_use_smart_correction"),
     ),
     "heating_performance": SettingsGroup(
         endpoint="heating-performance",
-        keys=["heating_performance_mode", "heating_performance_backup_temperature"],
+        keys=("heating_performance_mode", "heating_performance_backup_temperature"),
     ),
     "backup_heating": SettingsGroup(
         endpoint="backup-heating",
-        keys=["backup_heating_mode"],
+        keys=("backup_heating_mode",),
     ),
     "sound": SettingsGroup(
         endpoint="sound",
-        keys=["sound_mode", "sound_compressor_power", "sound_fan_speed"],
+        keys=("sound_mode", "sound_compressor_power", "sound_fan_speed"),
     ),
     "advanced": SettingsGroup(
         endpoint="advanced",
-        keys=["advanced_boost_mode_control", "advanced_thermostat_delay"],
+        keys=("advanced_boost_mode_control", "advanced_thermostat_delay"),
     ),
     "cooling": SettingsGroup(
         endpoint="cooling",
-        keys=["cooling_thermostat_type", "cooling_control_mode", 
-              "cooling_temperature", "cooling_duration"],
+        keys=("cooling_thermostat_type", "cooling_control_mode", 
+              "cooling_temperature", "cooling_duration"),
     ),
     "warm_water": SettingsGroup(
         endpoint="warm-water",
-        keys=["warm_water_is_scheduled", "warm_water_target_temperature"],
+        keys=("warm_water_is_scheduled", "warm_water_target_temperature"),
     ),
-} 
\ No newline at end of file
+})
+
+# Settings group for each setting key, so updates need a single lookup
+SETTING_GROUP_BY_KEY: Mapping[str, SettingsGroup] = MappingProxyType({
+    key: group for group in SETTING_GROUPS.values() for key in group.keys
+})
+
+# Settings only available on devices that support cooling
+COOLING_SETTING_KEYS = frozenset(SETTING_GROUPS["cooling"].keys) 
\ No newline at end of file
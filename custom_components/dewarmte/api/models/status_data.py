@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, get_args, get_origin, get_type_hints
+from typing import Any, Callable, get_args, get_origin, get_type_hints
 
-@dataclass
+@dataclass(slots=True)
 class StatusData:
     """Status data model from API."""
     water_flow: float | None = None
@@ -39,14 +39,12 @@ class StatusData:
     def update_from_dict(self, data: dict) -> None:
         """Incrementally update fields."""
         issues = list(self.invalid_fields)
-        type_hints = get_type_hints(StatusData)
 
-        for key, raw in data.items():
-            if key == "invalid_fields":
-                continue
-
-            annotation = type_hints.get(key)
-            if annotation is None:
+        # Walk the known fields rather than the payload, which carries many
+        # unrelated product keys
+        for key, convert in _FIELD_CONVERTERS:
+            raw = data.get(key, _MISSING)
+            if raw is _MISSING:
                 continue
 
             if raw in ("", None):
@@ -55,14 +53,7 @@ class StatusData:
                 continue
 
             try:
-                if _annotation_includes(annotation, bool):
-                    value = _coerce_bool(raw)
-                elif _annotation_includes(annotation, int):
-                    value = _coerce_int(raw)
-                elif _annotation_includes(annotation, float):
-                    value = _coerce_float(raw)
-                else:
-                    value = raw
+                value = convert(raw)
             except (TypeError, ValueError):
                 issues.append(f"{key}={raw!r} (invalid)")
                 value = None
@@ -72,6 +63,9 @@ class StatusData:
         self.invalid_fields = tuple(issues)
 
 
+_MISSING = object()
+
+
 def _annotation_includes(annotation: Any, target_type: type) -> bool:
     if annotation is target_type:
         return True
@@ -81,12 +75,8 @@ def _annotation_includes(annotation: Any, target_type: type) -> bool:
     return any(_annotation_includes(arg, target_type) for arg in get_args(annotation))
 
 
-def _coerce_float(value: Any) -> float:
-    return float(value)
-
-
-def _coerce_int(value: Any) -> int:
-    return int(value)
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on", "active"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off", "inactive"})
 
 
 def _coerce_bool(value: Any) -> bool:
@@ -94,10 +84,35 @@ def _coerce_bool(value: Any) -> bool:
         return value
     if isinstance(value, str):
         normalized = value.strip().lower()
-        if normalized in {"true", "1", "yes", "on", "active"}:
+        if normalized in _TRUE_STRINGS:
             return True
-        if normalized in {"false", "0", "no", "off", "inactive"}:
+        if normalized in _FALSE_STRINGS:
             return False
     if isinstance(value, (int, float)):
         return bool(value)
-    raise ValueError("Invalid boolean value")
\ No newline at end of file
+    raise ValueError("Invalid boolean value")
+
+
+def _coerce_raw(value: Any) -> Any:
+    return value
+
+
+def _field_converter(annotation: Any) -> Callable[[Any], Any]:
+    if _annotation_includes(annotation, bool):
+        return _coerce_bool
+    # The numeric builtins are used as converters directly, saving a Python
+    # wrapper call per field
+    if _annotation_includes(annotation, int):
+        return int
+    if _annotation_includes(annotation, float):
+        return float
+    return _coerce_raw
+
+
+# (field, converter) pairs for the status fields, resolved once from the type
+# hints instead of on every update
+_FIELD_CONVERTERS: tuple[tuple[str, Callable[[Any], Any]], ...] = tuple(
+    (key, _field_converter(annotation))
+    for key, annotation in get_type_hints(StatusData).items()
+    if key != "invalid_fields"
+)
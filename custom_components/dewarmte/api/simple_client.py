@@ -1,14 +1,19 @@
-"""Simple DeWarmte API client."""
-"""This is a new client that is the base of a future refactoring. it is not yet used."""
+"""Simple DeWarmte API client.
+
+This is a new client that is the base of a future refactoring. it is not yet used.
+"""
 from __future__ import annotations
 
+import asyncio
 import logging
 import ssl
 from typing import Any, TypeVar, Type, cast
 
 import aiohttp
+import orjson
 from aiohttp import ClientTimeout, TCPConnector
 
+from custom_components.dewarmte.api.auth import DeWarmteAuth
 from custom_components.dewarmte.api.models.device import Device
 from custom_components.dewarmte.api.models.settings import DeviceOperationSettings
 from custom_components.dewarmte.api.models.status_data import StatusData
@@ -18,6 +23,9 @@ _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Transport failures and unexpected payloads; anything else is a bug and propagates
+_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, KeyError, TypeError, ValueError)
+
 class DeWarmteSimpleApiClient:
     """Simple DeWarmte API client."""
 
@@ -42,20 +50,11 @@ class DeWarmteSimpleApiClient:
         self._verify_ssl = verify_ssl
         self._session: aiohttp.ClientSession | None = None
         self._token: str | None = None
-        self._base_url = "https://api.mydewarmte.com/v1"
-        self._headers = {
-            "Accept": "application/json",
-            "Accept-Language": "en-US",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Content-Type": "application/json",
-            "Origin": "https://mydewarmte.com",
-            "Referer": "https://mydewarmte.com/",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-site",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:136.0) Gecko/20100101 Firefox/136.0",
-            "Authorization": "Bearer null"  # Will be updated after login
-        }
+        self._base_url = API_BASE_URL
+        self._products_url = f"{self._base_url}/customer/products/"
+        self._tb_status_url = f"{self._base_url}/customer/products/tb-status/"
+        self._auth: DeWarmteAuth | None = None
+        self._headers: dict[str, str] = {}  # Taken from the auth handler after login
 
     def _create_session(self) -> aiohttp.ClientSession:
         """Create a new aiohttp session with proper SSL settings."""
@@ -63,7 +62,9 @@ class DeWarmteSimpleApiClient:
         if not self._verify_ssl and ssl_context:
             ssl_context.check_hostname = False
             ssl_context.verify_mode = ssl.CERT_NONE
-        connector = TCPConnector(ssl=ssl_context)
+        # Keep a small pool of keep-alive connections to the single API host so
+        # the requests of a refresh reuse TLS connections instead of reconnecting
+        connector = TCPConnector(ssl=ssl_context, limit=10, limit_per_host=5)
         return aiohttp.ClientSession(timeout=self._timeout, connector=connector)
 
     async def __aenter__(self) -> DeWarmteSimpleApiClient:
@@ -109,7 +110,7 @@ class DeWarmteSimpleApiClient:
             ) as response:
                 if response.status == expected_status:
                     if model_class:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         if isinstance(data, list):
                             return [model_class.from_dict(item) for item in data]
                         return model_class.from_dict(data)
@@ -121,8 +122,8 @@ class DeWarmteSimpleApiClient:
                     endpoint,
                 )
                 return None
-        except Exception as e:
-            _LOGGER.error("Request failed: %s %s - %s", method, endpoint, str(e))
+        except _REQUEST_ERRORS as e:
+            _LOGGER.error("Request failed: %s %s - %s", method, endpoint, e)
             return None
 
     async def login(self) -> bool:
@@ -134,27 +135,14 @@ class DeWarmteSimpleApiClient:
         if not self._session:
             self._session = self._create_session()
 
-        try:
-            # First get the access token
-            login_url = f"{self._base_url}/auth/token/"
-            login_data = {
-                "email": self._username,
-                "password": self._password,
-            }
-            async with self._session.post(login_url, json=login_data, headers=self._headers) as response:
-                if response.status != 200:
-                    _LOGGER.error("Login failed with status %d", response.status)
-                    return False
-                data = await response.json()
-                self._token = data.get("access")
-                if not self._token:
-                    _LOGGER.error("No access token in response")
-                    return False
-                self._headers["Authorization"] = f"Bearer {self._token}"
-                return True
-        except Exception as e:
-            _LOGGER.error("Login failed: %s", str(e))
+        if self._auth is None:
+            self._auth = DeWarmteAuth(self._username, self._password, self._session)
+
+        if not await self._auth.ensure_token(force=True):
             return False
+        self._token = self._auth.access_token
+        self._headers = self._auth.headers
+        return True
 
     async def get_device_info(self) -> Device | None:
         """Get device information.
@@ -167,21 +155,25 @@ class DeWarmteSimpleApiClient:
 
         try:
             # Get products info
-            products_url = f"{self._base_url}/customer/products/"
-            async with self._session.get(products_url, headers=self._headers) as response:
+            async with self._session.get(self._products_url, headers=self._headers) as response:
                 if response.status != 200:
                     _LOGGER.error("Failed to get products info with status %d", response.status)
                     return None
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 if data.get("results") and len(data["results"]) > 0:
                     product = data["results"][0]
                     device_id = product.get("id")
                     product_id = str(product.get("name"))
-                    return Device.from_api_response(device_id, product_id, self._token)
+                    return Device(
+                        device_id=device_id,
+                        product_id=product_id,
+                        access_token=self._token,
+                        device_type=product.get("type", "unknown"),
+                    )
                 _LOGGER.error("No products found in response")
                 return None
-        except Exception as e:
-            _LOGGER.error("Failed to get device info: %s", str(e))
+        except _REQUEST_ERRORS as e:
+            _LOGGER.error("Failed to get device info: %s", e)
             return None
 
     async def get_operation_settings(self, device_id: str) -> DeviceOperationSettings | None:
@@ -197,15 +189,15 @@ class DeWarmteSimpleApiClient:
             return None
 
         try:
-            settings_url = f"{self._base_url}/customer/products/{device_id}/settings/"
+            settings_url = f"{self._products_url}{device_id}/settings/"
             async with self._session.get(settings_url, headers=self._headers) as response:
                 if response.status != 200:
                     _LOGGER.error("Failed to get operation settings with status %d", response.status)
                     return None
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 return DeviceOperationSettings.from_api_response(data)
-        except Exception as e:
-            _LOGGER.error("Failed to get operation settings: %s", str(e))
+        except _REQUEST_ERRORS as e:
+            _LOGGER.error("Failed to get operation settings: %s", e)
             return None
 
     async def get_status_data(self, device_id: str) -> StatusData | None:
@@ -222,12 +214,11 @@ class DeWarmteSimpleApiClient:
 
         try:
             # Get main status data
-            products_url = f"{self._base_url}/customer/products/"
-            async with self._session.get(products_url, headers=self._headers) as response:
+            async with self._session.get(self._products_url, headers=self._headers) as response:
                 if response.status != 200:
                     _LOGGER.error("Failed to get status data with status %d", response.status)
                     return None
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 
                 # Find our device in the results
                 for product in data.get("results", []):
@@ -236,15 +227,14 @@ class DeWarmteSimpleApiClient:
                         status = {**product, **product.get("status", {})}
                         
                         # Get outdoor temperature from tb-status endpoint
-                        tb_status_url = f"{self._base_url}/customer/products/tb-status/"
-                        async with self._session.get(tb_status_url, headers=self._headers) as tb_response:
+                        async with self._session.get(self._tb_status_url, headers=self._headers) as tb_response:
                             if tb_response.status == 200:
-                                tb_data = await tb_response.json()
+                                tb_data = orjson.loads(await tb_response.read())
                                 if "outdoor_temperature" in tb_data:
                                     status["outdoor_temperature"] = tb_data["outdoor_temperature"]
                         
                         status_data = StatusData.from_dict(status)
-                        if status_data.invalid_fields:
+                        if status_data.invalid_fields and _LOGGER.isEnabledFor(logging.DEBUG):
                             _LOGGER.debug(
                                 "Device %s returned missing/invalid status fields: %s",
                                 device_id,
@@ -254,8 +244,8 @@ class DeWarmteSimpleApiClient:
                 
                 _LOGGER.error("Device not found in products response")
                 return None
-        except Exception as e:
-            _LOGGER.error("Failed to get status data: %s", str(e))
+        except _REQUEST_ERRORS as e:
+            _LOGGER.error("Failed to get status data: %s", e)
             return None
 
   
\ No newline at end of file
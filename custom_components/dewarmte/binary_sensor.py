@@ -2,8 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, cast
-from functools import cached_property
+from typing import Any, Callable, Optional
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -17,6 +16,28 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import _LOGGER, DeWarmteDataUpdateCoordinator
 from .const import DOMAIN
+from .descriptions import descriptions_by_device_type
+
+PARALLEL_UPDATES = 0
+
+# String values that are reported as "on"
+_TRUE_STRINGS = frozenset({"on", "true", "yes", "1", "active"})
+
+# Conversion of raw status values to a binary state, keyed on the exact value type.
+# Values of any other type (including None) have no state.
+_BOOL_CONVERTERS: dict[type, Callable[[Any], bool]] = {
+    bool: bool,
+    int: lambda value: value > 0,
+    float: lambda value: value > 0,
+    str: lambda value: value.lower() in _TRUE_STRINGS,
+}
+
+
+def _coerce(value: Any) -> bool | None:
+    """Convert a raw status value to a binary state."""
+    converter = _BOOL_CONVERTERS.get(type(value))
+    return converter(value) if converter is not None else None
+
 
 @dataclass(frozen=True)
 class DeWarmteBinarySensorEntityDescription(BinarySensorEntityDescription):
@@ -24,40 +45,41 @@ class DeWarmteBinarySensorEntityDescription(BinarySensorEntityDescription):
 
     # Required fields (no default values)
     key: str
-    device_types: tuple[str, ...] = ("AO", "PT", "HC")  # Device types this sensor applies to
+    device_types: frozenset[str] = frozenset({"AO", "PT", "HC"})  # Device types this sensor applies to
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[DeWarmteBinarySensorEntityDescription, ...] = (
     DeWarmteBinarySensorEntityDescription(
         key="gas_boiler",
         name="Gas Boiler",
         device_class=BinarySensorDeviceClass.HEAT,
-        device_types=("AO", "MP"),  # AO/MP-specific: gas boiler backup heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: gas boiler backup heating
     ),
     DeWarmteBinarySensorEntityDescription(
         key="thermostat",
         name="Thermostat",
         device_class=BinarySensorDeviceClass.HEAT,
-        device_types=("AO", "MP"),  # AO/MP-specific: space heating thermostat
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: space heating thermostat
     ),
     DeWarmteBinarySensorEntityDescription(
         key="is_on",
         name="Is On",
         device_class=BinarySensorDeviceClass.RUNNING,
-        device_types=("AO", "PT", "MP"),  # AO/PT/MP only: HC devices don't provide this field
+        device_types=frozenset({"AO", "PT", "MP"}),  # AO/PT/MP only: HC devices don't provide this field
     ),
     DeWarmteBinarySensorEntityDescription(
         key="is_connected",
         name="Is Connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        device_types=("AO", "PT", "MP"),  # AO/PT/MP only: HC devices don't provide this field
+        device_types=frozenset({"AO", "PT", "MP"}),  # AO/PT/MP only: HC devices don't provide this field
     ),
 )
 
+BINARY_SENSORS_BY_TYPE = descriptions_by_device_type(BINARY_SENSOR_DESCRIPTIONS)
+
 class DeWarmteBinarySensor(CoordinatorEntity[DeWarmteDataUpdateCoordinator], BinarySensorEntity): # type: ignore[override]
     """Representation of a DeWarmte binary sensor."""
-    _attr_has_entity_name = True
 
-    
+    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -68,29 +90,16 @@ class DeWarmteBinarySensor(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Bin
         super().__init__(coordinator)
         assert coordinator.device is not None, "Coordinator device must not be None"
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device.device_id}_{description.key}"
+        self.dewarmte_description: DeWarmteBinarySensorEntityDescription = description
+        self._data_key = description.key
+        self._attr_unique_id = coordinator.unique_id_prefix + description.key
         self._attr_device_info = coordinator.device_info
 
-    @property
-    def dewarmte_description(self) -> DeWarmteBinarySensorEntityDescription:
-        """Get the DeWarmte specific entity description."""
-        return cast(DeWarmteBinarySensorEntityDescription, self.entity_description)
-
     @property
     def is_on(self) -> bool | None:
         """Return the state of the binary sensor."""
-        if self.coordinator.data:
-            value = getattr(self.coordinator.data, self.dewarmte_description.key, None)
-            # Convert various possible values to boolean
-            if value is None:
-                return None
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                return value.lower() in ["on", "true", "yes", "1", "active"]
-            if isinstance(value, (int, float)):
-                return value > 0
-        return None
+        data = self.coordinator.data
+        return None if data is None else _coerce(getattr(data, self._data_key, None))
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -101,22 +110,23 @@ async def async_setup_entry(
     coordinators = hass.data[DOMAIN][entry.entry_id]
 
     if not isinstance(coordinators, list):
-        coordinators = [coordinators]
+        coordinators = (coordinators,)
 
+    binary_sensors: list[DeWarmteBinarySensor] = []
     for coordinator in coordinators:
-        # Filter binary sensor descriptions based on device type
-        filtered_descriptions = [
-            description for description in BINARY_SENSOR_DESCRIPTIONS
-            if coordinator.device.device_type in description.device_types
-        ]
-        
-        # Create binary sensors per device with filtered descriptions
-        binary_sensors = [
-            DeWarmteBinarySensor(coordinator, description) 
-            for description in filtered_descriptions
-        ]
+        # Binary sensor descriptions for this device type
+        filtered_descriptions = BINARY_SENSORS_BY_TYPE.get(coordinator.device.device_type, ())
         _LOGGER.debug("Adding %d binary sensors for device %s (type: %s)",
-                     len(binary_sensors),
+                     len(filtered_descriptions),
                      coordinator.device.device_id if coordinator.device else "unknown",
                      coordinator.device.device_type)
-        async_add_entities(binary_sensors) 
\ No newline at end of file
+
+        # Create binary sensors per device with filtered descriptions
+        binary_sensors.extend(
+            DeWarmteBinarySensor(coordinator, description)
+            for description in filtered_descriptions
+        )
+
+    # Add the entities of all devices in a single call
+    if binary_sensors:
+        async_add_entities(binary_sensors)
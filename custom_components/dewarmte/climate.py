@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Any, cast, final
+from types import MappingProxyType
+from typing import Any, final, Mapping
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -20,8 +22,11 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DeWarmteDataUpdateCoordinator
 from .const import DOMAIN
+from .descriptions import descriptions_by_device_type
 from .api.models.settings import WarmWaterRange
 
+PARALLEL_UPDATES = 1
+
 _LOGGER = logging.getLogger(__name__)
 
 # Warm water temperature constants
@@ -29,18 +34,36 @@ MIN_WARM_WATER_TEMP = 40.0
 MAX_WARM_WATER_TEMP = 70.0
 DEFAULT_WARM_WATER_TEMP = 55.0
 
+# Preset lookup: a target temperature up to and including a threshold maps to
+# the preset at the same index; anything above the last threshold is "away"
+_PRESET_THRESHOLDS = (45.0, 55.0, 65.0)
+_PRESET_NAMES = ("eco", "comfort", "boost", "away")
+_PRESET_TEMP_MAP = {
+    "eco": 45.0,
+    "comfort": 55.0,
+    "boost": 65.0,
+    "away": 40.0,
+}
+
+# Warm water schedule periods
+_DAY_PERIOD = "06:00-22:00"
+_NIGHT_PERIOD = "22:00-06:00"
+_ALL_DAY_PERIOD = "00:00-00:00"
+
 @dataclass(frozen=True)
 class DeWarmteClimateEntityDescription(ClimateEntityDescription):
     """Class describing DeWarmte climate entities."""
-    device_types: tuple[str, ...] = ("PT", "HC")  # Device types this climate applies to
+    device_types: frozenset[str] = frozenset({"PT", "HC"})  # Device types this climate applies to
 
-CLIMATE_DESCRIPTIONS = {
+CLIMATE_DESCRIPTIONS: Mapping[str, DeWarmteClimateEntityDescription] = MappingProxyType({
     "warm_water": DeWarmteClimateEntityDescription(
         key="warm_water",
         name="Warm Water",
-        device_types=("PT", "HC"),  # PT/HC-specific: warm water control for heat pumps
+        device_types=frozenset({"PT", "HC"}),  # PT/HC-specific: warm water control for heat pumps
     ),
-}
+})
+
+CLIMATES_BY_TYPE = descriptions_by_device_type(CLIMATE_DESCRIPTIONS.values())
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,27 +75,26 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up DeWarmte climate platform")
 
     if not isinstance(coordinators, list):
-        coordinators = [coordinators]
+        coordinators = (coordinators,)
 
+    climates: list[DeWarmteClimateEntity] = []
     for coordinator in coordinators:
-        # Filter climate descriptions by device type
-        filtered_descriptions = [
-            description for description in CLIMATE_DESCRIPTIONS.values()
-            if coordinator.device.device_type in description.device_types
-        ]
-        
-        climates = [
-            DeWarmteClimateEntity(coordinator, description)
-            for description in filtered_descriptions
-        ]
-        
+        # Climate descriptions for this device type
+        filtered_descriptions = CLIMATES_BY_TYPE.get(coordinator.device.device_type, ())
+
         _LOGGER.debug("Adding %d climate entities for device %s (type: %s)",
-                     len(climates),
+                     len(filtered_descriptions),
                      coordinator.device.device_id if coordinator.device else "unknown",
                      coordinator.device.device_type)
-        
-        if climates:
-            async_add_entities(climates)
+
+        climates.extend(
+            DeWarmteClimateEntity(coordinator, description)
+            for description in filtered_descriptions
+        )
+
+    # Add the entities of all devices in a single call
+    if climates:
+        async_add_entities(climates)
 
 @final
 class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], ClimateEntity):
@@ -99,47 +121,32 @@ class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Cl
         super().__init__(coordinator)
         assert coordinator.device is not None, "Coordinator device must not be None"
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device.device_id}_{description.key}"
+        self.dewarmte_description: DeWarmteClimateEntityDescription = description
+        self._attr_unique_id = coordinator.unique_id_prefix + description.key
         self._attr_device_info = coordinator.device_info
 
-    @property
-    def dewarmte_description(self) -> DeWarmteClimateEntityDescription:
-        """Get the DeWarmte specific entity description."""
-        return cast(DeWarmteClimateEntityDescription, self.entity_description)
-
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        if not self.coordinator.data:
-            return None
-        
+        data = self.coordinator.data
         # Use top boiler temperature as current temperature for warm water
-        if hasattr(self.coordinator.data, 'top_boiler_temp'):
-            return self.coordinator.data.top_boiler_temp
-        return None
+        return None if data is None else data.top_boiler_temp
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        if not hasattr(self.coordinator, '_cached_settings') or not self.coordinator._cached_settings:
+        settings = getattr(self.coordinator, "_cached_settings", None)
+        if settings is None or not settings.warm_water_ranges:
             return DEFAULT_WARM_WATER_TEMP
-        
-        # Get current warm water ranges from settings
-        settings = self.coordinator._cached_settings
-        if hasattr(settings, 'warm_water_ranges') and settings.warm_water_ranges:
-            # Return the temperature from the first range
-            return settings.warm_water_ranges[0].temperature
-        
-        return DEFAULT_WARM_WATER_TEMP
+
+        # Return the temperature from the first range
+        return settings.warm_water_ranges[0].temperature
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
-        if not hasattr(self.coordinator, '_cached_settings') or not self.coordinator._cached_settings:
-            return HVACMode.OFF
-        
-        settings = self.coordinator._cached_settings
-        if hasattr(settings, 'warm_water_is_scheduled') and settings.warm_water_is_scheduled:
+        settings = getattr(self.coordinator, "_cached_settings", None)
+        if settings is not None and settings.warm_water_is_scheduled:
             return HVACMode.HEAT
         return HVACMode.OFF
 
@@ -149,15 +156,8 @@ class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Cl
         target_temp = self.target_temperature
         if target_temp is None:
             return "comfort"
-        
-        if target_temp <= 45:
-            return "eco"
-        elif target_temp <= 55:
-            return "comfort"
-        elif target_temp <= 65:
-            return "boost"
-        else:
-            return "away"
+
+        return _PRESET_NAMES[bisect_left(_PRESET_THRESHOLDS, target_temp)]
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode (scheduled vs manual)."""
@@ -187,14 +187,7 @@ class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Cl
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
-        temp_map = {
-            "eco": 45.0,
-            "comfort": 55.0,
-            "boost": 65.0,
-            "away": 40.0,
-        }
-        
-        target_temp = temp_map.get(preset_mode, 55.0)
+        target_temp = _PRESET_TEMP_MAP.get(preset_mode, DEFAULT_WARM_WATER_TEMP)
         await self.async_set_temperature(temperature=target_temp)
 
     async def _set_scheduled_mode_with_default_ranges(self) -> None:
@@ -206,12 +199,12 @@ class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Cl
             WarmWaterRange(
                 order=0,
                 temperature=current_temp,
-                period="06:00-22:00"  # Day time
+                period=_DAY_PERIOD  # Day time
             ),
             WarmWaterRange(
                 order=1, 
                 temperature=max(MIN_WARM_WATER_TEMP, current_temp - 10),  # Night time (eco)
-                period="22:00-06:00"
+                period=_NIGHT_PERIOD
             )
         ]
         
@@ -219,11 +212,11 @@ class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Cl
 
     async def _update_warm_water_ranges_with_temperature(self, target_temp: float) -> None:
         """Update warm water ranges with new temperature while keeping schedule structure."""
-        if not hasattr(self.coordinator, '_cached_settings') or not self.coordinator._cached_settings:
+        settings = getattr(self.coordinator, "_cached_settings", None)
+        if settings is None:
             return
-        
-        settings = self.coordinator._cached_settings
-        if not hasattr(settings, 'warm_water_ranges') or not settings.warm_water_ranges:
+
+        if not settings.warm_water_ranges:
             # No existing ranges, create default schedule
             await self._set_scheduled_mode_with_default_ranges()
             return
@@ -245,7 +238,7 @@ class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Cl
             WarmWaterRange(
                 order=0,
                 temperature=target_temp,
-                period="00:00-00:00"  # 24/7 period
+                period=_ALL_DAY_PERIOD  # 24/7 period
             )
         ]
         
@@ -253,37 +246,12 @@ class DeWarmteClimateEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Cl
 
     async def _update_warm_water_ranges(self, ranges: list[WarmWaterRange]) -> None:
         """Update warm water ranges via API."""
-        # First enable scheduled mode
-        await self.coordinator.api.async_update_operation_settings(
-            self.coordinator.device, "warm_water_is_scheduled", True
-        )
-        
-        # Then update the ranges
-        url = f"{self.coordinator.api._base_url}/customer/products/{self.coordinator.device.device_id}/settings/warm-water/"
-        
-        # Convert WarmWaterRange objects to dicts for API
-        ranges_dict = [
-            {
-                "order": range_obj.order,
-                "temperature": range_obj.temperature,
-                "period": range_obj.period
-            }
-            for range_obj in ranges
-        ]
-        
-        update_data = {
-            "warm_water_is_scheduled": True,
-            "warm_water_ranges": ranges_dict
-        }
-        
-        _LOGGER.debug("Updating warm water ranges: %s", update_data)
-        
+        _LOGGER.debug("Updating warm water ranges: %s", ranges)
         try:
-            response = await self.coordinator.api._request_with_retry("POST", url, json=update_data)
-            if response is None:
-                raise Exception("API request failed: no response")
-            
+            await self.coordinator.api.async_update_warm_water_ranges(
+                self.coordinator.device, ranges
+            )
             _LOGGER.debug("Successfully updated warm water ranges")
-        except Exception as e:
+        except ValueError as e:
             _LOGGER.error("Error updating warm water ranges: %s", e)
             raise
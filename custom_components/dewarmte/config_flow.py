@@ -1,9 +1,11 @@
 """Config flow for DeWarmte integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
@@ -18,32 +20,93 @@ from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
+# Polling interval in seconds; rejected in the form when out of range
+UPDATE_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=10, max=3600))
+
+STEP_CREDENTIALS_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USERNAME): str,
         vol.Required(CONF_PASSWORD): str,
-        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): int,
     }
 )
 
+STEP_USER_DATA_SCHEMA = STEP_CREDENTIALS_DATA_SCHEMA.extend(
+    {
+        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): UPDATE_INTERVAL_VALIDATOR,
+    }
+)
+
+# The current interval is filled in as suggested value when the form is shown
+STEP_UPDATE_INTERVAL_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_UPDATE_INTERVAL): UPDATE_INTERVAL_VALIDATOR,
+    }
+)
+
+
+def _get_client(
+    hass: HomeAssistant,
+    client: DeWarmteApiClient | None,
+    *,
+    username: str,
+    password: str,
+    update_interval: int,
+) -> DeWarmteApiClient:
+    """Return an API client for the given credentials.
+
+    The client of an earlier attempt in the same flow is reused when the
+    credentials did not change.
+    """
+    if (
+        client is not None
+        and client.settings.username == username
+        and client.settings.password == password
+    ):
+        return client
 
-async def _async_validate_login(
-    hass: HomeAssistant, *, username: str, password: str, update_interval: int
-) -> None:
-    """Validate the given credentials allow us to connect."""
-    session = async_get_clientsession(hass)
     connection_settings = ConnectionSettings(
         username=username,
         password=password,
         update_interval=update_interval,
     )
-    client = DeWarmteApiClient(connection_settings=connection_settings, session=session)
+    return DeWarmteApiClient(
+        connection_settings=connection_settings,
+        session=async_get_clientsession(hass),
+    )
+
+
+class InvalidAuth(HomeAssistantError):
+    """Error to indicate there is invalid auth."""
+
+
+# Expected validation failures and the form error shown for each; anything
+# else is logged as unexpected
+_ERROR_MAP: dict[type[Exception], str] = {
+    InvalidAuth: "invalid_auth",
+    aiohttp.ClientConnectionError: "cannot_connect",
+    asyncio.TimeoutError: "cannot_connect",
+    aiohttp.ClientError: "api_error",
+}
+_EXPECTED_ERRORS = tuple(_ERROR_MAP)
+
+
+def _error_key(err: Exception) -> str:
+    """Return the form error for an expected validation failure."""
+    for error_type in type(err).__mro__:
+        if (key := _ERROR_MAP.get(error_type)) is not None:
+            return key
+    return "unknown"
 
-    try:
-        if not await client._auth.ensure_token():
-            raise InvalidAuth
-    except Exception as err:
-        raise InvalidAuth from err
+
+def _unique_id(username: str) -> str:
+    """Return the config entry unique ID for an account."""
+    return f"{DOMAIN}_{username}"
+
+
+async def _async_validate_login(client: DeWarmteApiClient) -> None:
+    """Validate the client's credentials allow us to connect."""
+    if not await client.async_validate_credentials():
+        raise InvalidAuth
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -51,6 +114,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._client: DeWarmteApiClient | None = None
+
     @staticmethod
     def async_get_options_flow(
         config_entry: config_entries.ConfigEntry,
@@ -65,19 +132,27 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            # Abort on an already configured account before logging in
+            await self.async_set_unique_id(_unique_id(user_input[CONF_USERNAME]))
+            self._abort_if_unique_id_configured()
+
+            self._client = _get_client(
+                self.hass,
+                self._client,
+                username=user_input[CONF_USERNAME],
+                password=user_input[CONF_PASSWORD],
+                update_interval=user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+            )
             try:
-                await _async_validate_login(
-                    self.hass,
-                    username=user_input[CONF_USERNAME],
-                    password=user_input[CONF_PASSWORD],
-                    update_interval=user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-                )
-            except InvalidAuth:
-                errors["base"] = "invalid_auth"
+                await _async_validate_login(self._client)
+            except _EXPECTED_ERRORS as err:
+                errors["base"] = _error_key(err)
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
+                # The entry sets up its own client; drop the validated one
+                self._client = None
                 return self.async_create_entry(
                     title=f"DeWarmte ({user_input[CONF_USERNAME]})",
                     data={
@@ -95,16 +170,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
-class InvalidAuth(HomeAssistantError):
-    """Error to indicate there is invalid auth.""" 
-
-
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle DeWarmte options."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize DeWarmte options flow."""
         self._config_entry = config_entry
+        self._client: DeWarmteApiClient | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -131,12 +203,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             CONF_UPDATE_INTERVAL,
             self._config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
         )
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_UPDATE_INTERVAL, default=current_interval): int,
-            }
+        return self.async_show_form(
+            step_id="update_interval",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_UPDATE_INTERVAL_DATA_SCHEMA,
+                {CONF_UPDATE_INTERVAL: current_interval},
+            ),
         )
-        return self.async_show_form(step_id="update_interval", data_schema=schema)
 
     async def async_step_credentials(
         self, user_input: dict[str, Any] | None = None
@@ -145,23 +218,38 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            unique_id = _unique_id(user_input[CONF_USERNAME])
+            existing_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+                DOMAIN, unique_id
+            )
+            if existing_entry is not None and existing_entry.entry_id != self._config_entry.entry_id:
+                errors["base"] = "already_configured"
+                return self.async_show_form(
+                    step_id="credentials",
+                    data_schema=STEP_CREDENTIALS_DATA_SCHEMA,
+                    errors=errors,
+                )
+
             update_interval = self._config_entry.options.get(
                 CONF_UPDATE_INTERVAL,
                 self._config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
             )
+            self._client = _get_client(
+                self.hass,
+                self._client,
+                username=user_input[CONF_USERNAME],
+                password=user_input[CONF_PASSWORD],
+                update_interval=update_interval,
+            )
             try:
-                await _async_validate_login(
-                    self.hass,
-                    username=user_input[CONF_USERNAME],
-                    password=user_input[CONF_PASSWORD],
-                    update_interval=update_interval,
-                )
-            except InvalidAuth:
-                errors["base"] = "invalid_auth"
+                await _async_validate_login(self._client)
+            except _EXPECTED_ERRORS as err:
+                errors["base"] = _error_key(err)
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception while validating credentials")
                 errors["base"] = "unknown"
             else:
+                self._client = None
                 updated_data = dict(self._config_entry.data)
                 updated_data[CONF_USERNAME] = user_input[CONF_USERNAME]
                 updated_data[CONF_PASSWORD] = user_input[CONF_PASSWORD]
@@ -169,20 +257,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     self._config_entry,
                     title=f"DeWarmte ({updated_data[CONF_USERNAME]})",
                     data=updated_data,
+                    unique_id=unique_id,
                 )
                 # Return existing options unchanged so we don't overwrite them.
                 return self.async_create_entry(
                     title="", data=dict(self._config_entry.options)
                 )
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_USERNAME): str,
-                vol.Required(CONF_PASSWORD): str,
-            }
-        )
         return self.async_show_form(
             step_id="credentials",
-            data_schema=schema,
+            data_schema=STEP_CREDENTIALS_DATA_SCHEMA,
             errors=errors,
         )
\ No newline at end of file
@@ -4,9 +4,7 @@ from typing import Final
 # Integration domain
 DOMAIN: Final = "dewarmte"
 
-# Configuration constants
-CONF_USERNAME = "username"
-CONF_PASSWORD = "password"
+# Configuration constants (username/password use homeassistant.const)
 CONF_UPDATE_INTERVAL = "update_interval"
 
 # Default values
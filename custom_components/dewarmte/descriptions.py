@@ -0,0 +1,33 @@
+"""Helpers shared by the DeWarmte entity description tables."""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Iterable, Mapping, Protocol, TypeVar
+
+
+class _DeviceTypeDescription(Protocol):
+    """Entity description limited to a set of device types."""
+
+    @property
+    def device_types(self) -> frozenset[str]:
+        """Return the device types the entity applies to."""
+
+
+DescriptionT = TypeVar("DescriptionT", bound=_DeviceTypeDescription)
+
+
+def descriptions_by_device_type(
+    descriptions: Iterable[DescriptionT],
+) -> Mapping[str, tuple[DescriptionT, ...]]:
+    """Group descriptions per device type, keeping their order.
+
+    Platforms build this once at import, so setup does not re-filter the
+    descriptions for every device.
+    """
+    by_type: dict[str, list[DescriptionT]] = {}
+    for description in descriptions:
+        for device_type in description.device_types:
+            by_type.setdefault(device_type, []).append(description)
+    return MappingProxyType(
+        {device_type: tuple(matching) for device_type, matching in by_type.items()}
+    )
@@ -2,8 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, cast
-from functools import cached_property
+from typing import Any
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -17,7 +16,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DeWarmteDataUpdateCoordinator, _LOGGER
 from .const import DOMAIN
-from .api.models.settings import SETTING_GROUPS
+from .descriptions import descriptions_by_device_type
+from .api.models.settings import COOLING_SETTING_KEYS
+
+PARALLEL_UPDATES = 1
 
 # Temperature constants
 MIN_OUTSIDE_TEMP = -10.0
@@ -36,87 +38,87 @@ MAX_COOLING_DURATION = 259200  # 3 days in seconds
 @dataclass(frozen=True)
 class DeWarmteNumberEntityDescription(NumberEntityDescription):
     """Class describing DeWarmte number entities."""
-    device_types: tuple[str, ...] = ("AO", "PT", "HC")  # Device types this number applies to
+    device_types: frozenset[str] = frozenset({"AO", "PT", "HC"})  # Device types this number applies to
 
 # Warm water temperature constants
 MIN_WARM_WATER_TEMP = 40.0
 MAX_WARM_WATER_TEMP = 70.0
 
 # All number entity descriptions
-NUMBER_DESCRIPTIONS = {
-    "heat_curve_s1_outside_temp": DeWarmteNumberEntityDescription(
+NUMBER_DESCRIPTIONS: tuple[DeWarmteNumberEntityDescription, ...] = (
+    DeWarmteNumberEntityDescription(
         key="heat_curve_s1_outside_temp",
         name="Heat Curve S1 Outside Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=MIN_OUTSIDE_TEMP,
         native_max_value=MAX_OUTSIDE_TEMP,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: heat curve settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heat curve settings for space heating
     ),
-    "heat_curve_s1_target_temp": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="heat_curve_s1_target_temp",
         name="Heat Curve S1 Target Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=MIN_TARGET_TEMP,
         native_max_value=MAX_TARGET_TEMP,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: heat curve settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heat curve settings for space heating
     ),
-    "heat_curve_s2_outside_temp": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="heat_curve_s2_outside_temp",
         name="Heat Curve S2 Outside Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=MIN_OUTSIDE_TEMP,
         native_max_value=MAX_OUTSIDE_TEMP,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: heat curve settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heat curve settings for space heating
     ),
-    "heat_curve_s2_target_temp": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="heat_curve_s2_target_temp",
         name="Heat Curve S2 Target Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=MIN_TARGET_TEMP,
         native_max_value=MAX_TARGET_TEMP,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: heat curve settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heat curve settings for space heating
     ),
-    "heat_curve_fixed_temperature": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="heat_curve_fixed_temperature",
         name="Heat Curve Fixed Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=MIN_TARGET_TEMP,
         native_max_value=MAX_TARGET_TEMP,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: heat curve settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heat curve settings for space heating
     ),
-    "heating_performance_backup_temperature": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="heating_performance_backup_temperature",
         name="Heating Performance Backup Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=MIN_BACKUP_TEMP,
         native_max_value=MAX_BACKUP_TEMP,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: heating performance settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heating performance settings for space heating
     ),
-    "cooling_temperature": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="cooling_temperature",
         name="Cooling Temperature",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         native_min_value=MIN_COOLING_TEMP,
         native_max_value=MAX_COOLING_TEMP,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: cooling settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: cooling settings for space heating
     ),
-    "cooling_duration": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="cooling_duration",
         name="Cooling Duration",
         native_unit_of_measurement=UnitOfTime.SECONDS,
         native_min_value=MIN_COOLING_DURATION,
         native_max_value=MAX_COOLING_DURATION,
         native_step=1.0,
-        device_types=("AO", "MP"),  # AO/MP-specific: cooling settings for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: cooling settings for space heating
     ),
-    "warm_water_target_temperature": DeWarmteNumberEntityDescription(
+    DeWarmteNumberEntityDescription(
         key="warm_water_target_temperature",
         name="Warm Water Target Temperature",
         #translation_key="warm_water_target_temperature",
@@ -124,9 +126,11 @@ NUMBER_DESCRIPTIONS = {
         native_min_value=MIN_WARM_WATER_TEMP,
         native_max_value=MAX_WARM_WATER_TEMP,
         native_step=5.0,
-        device_types=("PT",),  # PT-specific: warm water temperature settings for heat pumps
+        device_types=frozenset({"PT"}),  # PT-specific: warm water temperature settings for heat pumps
     ),
-}
+)
+
+NUMBERS_BY_TYPE = descriptions_by_device_type(NUMBER_DESCRIPTIONS)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -137,25 +141,22 @@ async def async_setup_entry(
     coordinators = hass.data[DOMAIN][entry.entry_id]
 
     if not isinstance(coordinators, list):
-        coordinators = [coordinators]
+        coordinators = (coordinators,)
 
     for coordinator in coordinators:
-        entities = []
-        
-        # Filter descriptions by device type
-        filtered_descriptions = [
-            description for description in NUMBER_DESCRIPTIONS.values()
-            if coordinator.device.device_type in description.device_types
+        assert coordinator.device is not None, "Coordinator device must not be None"
+
+        # Number descriptions for this device type
+        filtered_descriptions = NUMBERS_BY_TYPE.get(coordinator.device.device_type, ())
+        supports_cooling = coordinator.device.supports_cooling
+
+        # Add entities for filtered descriptions, skipping cooling entities if
+        # cooling is not supported
+        entities = [
+            DeWarmteNumberEntity(coordinator, description)
+            for description in filtered_descriptions
+            if supports_cooling or description.key not in COOLING_SETTING_KEYS
         ]
-        
-        # Add entities for filtered descriptions
-        for description in filtered_descriptions:
-            # Skip cooling entities if cooling is not supported
-            if description.key in SETTING_GROUPS["cooling"].keys:
-                assert coordinator.device is not None, "Coordinator device must not be None"
-                if not coordinator.device.supports_cooling:
-                    continue
-            entities.append(DeWarmteNumberEntity(coordinator, description))
 
         _LOGGER.debug("Adding %d number entities for device %s (type: %s)",
                      len(entities),
@@ -179,39 +180,34 @@ class DeWarmteNumberEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Num
         super().__init__(coordinator)
         assert coordinator.device is not None, "Coordinator device must not be None"
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device.device_id}_{description.key}"
+        # Settings attribute this entity reads and writes
+        self._setting_key = description.key
+        self._attr_unique_id = coordinator.unique_id_prefix + description.key
         self._attr_device_info = coordinator.device_info
-
-    @property
-    def dewarmte_description(self) -> DeWarmteNumberEntityDescription:
-        """Get the DeWarmte specific entity description."""
-        return cast(DeWarmteNumberEntityDescription, self.entity_description)
+        # Copy the static description values up front so state writes read
+        # them directly instead of falling back to the entity description
+        self._attr_name = description.name
+        self._attr_device_class = description.device_class
+        self._attr_native_unit_of_measurement = description.native_unit_of_measurement
+        self._attr_native_min_value = description.native_min_value
+        self._attr_native_max_value = description.native_max_value
+        self._attr_native_step = description.native_step
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
         # Settings are cached in coordinator, read from there
-        if not hasattr(self.coordinator, '_cached_settings'):
-            return None
-            
-        settings = self.coordinator._cached_settings
-        key = self.dewarmte_description.key
+        settings = getattr(self.coordinator, "_cached_settings", None)
 
-        # Get the raw value and ensure it's a float
-        value = getattr(settings, key, None)
-        if value is None:
-            return None
-            
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return None
+        # DeviceOperationSettings.from_api_response already coerces the
+        # numeric settings, so no conversion is needed here
+        return getattr(settings, self._setting_key, None)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        key = self.dewarmte_description.key
-        
         # Standard handling for all number entities
-        await self.coordinator.api.async_update_operation_settings(self.coordinator.device, key, value)
+        await self.coordinator.api.async_update_operation_settings(
+            self.coordinator.device, self._setting_key, value
+        )
             
         await self.coordinator.async_request_refresh() 
\ No newline at end of file
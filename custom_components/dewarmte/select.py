@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, cast
+from types import MappingProxyType
+from typing import Any, Mapping
 from enum import Enum
 
 from homeassistant.components.select import (
@@ -16,7 +17,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DeWarmteDataUpdateCoordinator
 from .const import DOMAIN
-from .api.models.settings import SETTING_GROUPS
+from .descriptions import descriptions_by_device_type
+from .api.models.settings import COOLING_SETTING_KEYS
+
+PARALLEL_UPDATES = 1
 
 class HeatCurveMode(str, Enum):
     """Heat curve mode settings."""
@@ -75,70 +79,78 @@ class CoolingControlMode(str, Enum):
 @dataclass(frozen=True)
 class DeWarmteSelectEntityDescription(SelectEntityDescription):
     """Class describing DeWarmte select entities."""
-    options_enum: type[Enum] | None = None
-
-MODE_SELECTS = {
-    "heat_curve_mode": DeWarmteSelectEntityDescription(
+    device_types: frozenset[str] = frozenset({"AO", "MP"})  # T devices have no settings
+
+# Option values per enum, built once and shared by descriptions using the same enum
+_ENUM_OPTIONS: Mapping[type[Enum], list[str]] = MappingProxyType({
+    enum: [member.value for member in enum]
+    for enum in (
+        HeatCurveMode,
+        HeatingKind,
+        HeatingPerformanceMode,
+        SoundMode,
+        PowerLevel,
+        ThermostatDelay,
+        BackupHeatingMode,
+        CoolingThermostatType,
+        CoolingControlMode,
+    )
+})
+
+MODE_SELECTS: tuple[DeWarmteSelectEntityDescription, ...] = (
+    DeWarmteSelectEntityDescription(
         key="heat_curve_mode",
         name="Heat Curve Mode",
-        options_enum=HeatCurveMode,
-        options=[mode.value for mode in HeatCurveMode],
+        options=_ENUM_OPTIONS[HeatCurveMode],
     ),
-    "heating_kind": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="heating_kind",
         name="Heating Kind",
-        options_enum=HeatingKind,
-        options=[kind.value for kind in HeatingKind],
+        options=_ENUM_OPTIONS[HeatingKind],
     ),
-    "heating_performance_mode": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="heating_performance_mode",
         name="Heating Performance Mode",
-        options_enum=HeatingPerformanceMode,
-        options=[mode.value for mode in HeatingPerformanceMode],
+        options=_ENUM_OPTIONS[HeatingPerformanceMode],
     ),
-    "sound_mode": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="sound_mode",
         name="Sound Mode",
-        options_enum=SoundMode,
-        options=[mode.value for mode in SoundMode],
+        options=_ENUM_OPTIONS[SoundMode],
     ),
-    "sound_compressor_power": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="sound_compressor_power",
         name="Sound Compressor Power",
-        options_enum=PowerLevel,
-        options=[level.value for level in PowerLevel],
+        options=_ENUM_OPTIONS[PowerLevel],
     ),
-    "sound_fan_speed": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="sound_fan_speed",
         name="Sound Fan Speed",
-        options_enum=PowerLevel,
-        options=[level.value for level in PowerLevel],
+        options=_ENUM_OPTIONS[PowerLevel],
     ),
-    "advanced_thermostat_delay": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="advanced_thermostat_delay",
         name="Advanced Thermostat Delay",
-        options_enum=ThermostatDelay,
-        options=[delay.value for delay in ThermostatDelay],
+        options=_ENUM_OPTIONS[ThermostatDelay],
     ),
-    "backup_heating_mode": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="backup_heating_mode",
         name="Backup Heating Mode",
-        options_enum=BackupHeatingMode,
-        options=[mode.value for mode in BackupHeatingMode],
+        options=_ENUM_OPTIONS[BackupHeatingMode],
     ),
-    "cooling_thermostat_type": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="cooling_thermostat_type",
         name="Cooling Thermostat Type",
-        options_enum=CoolingThermostatType,
-        options=[type.value for type in CoolingThermostatType],
+        options=_ENUM_OPTIONS[CoolingThermostatType],
     ),
-    "cooling_control_mode": DeWarmteSelectEntityDescription(
+    DeWarmteSelectEntityDescription(
         key="cooling_control_mode",
         name="Cooling Control Mode",
-        options_enum=CoolingControlMode,
-        options=[mode.value for mode in CoolingControlMode],
+        options=_ENUM_OPTIONS[CoolingControlMode],
     ),
-}
+)
+
+SELECTS_BY_TYPE = descriptions_by_device_type(MODE_SELECTS)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -149,22 +161,21 @@ async def async_setup_entry(
     coordinators = hass.data[DOMAIN][entry.entry_id]
 
     if not isinstance(coordinators, list):
-        coordinators = [coordinators]
+        coordinators = (coordinators,)
 
     for coordinator in coordinators:
-        # Only create select entities for AO and MP devices (T devices have no settings)
-        if not coordinator.device.product_id.startswith(("AO ", "MP ")):
+        # Select descriptions for this device type
+        filtered_descriptions = SELECTS_BY_TYPE.get(coordinator.device.device_type, ())
+        if not filtered_descriptions:
             continue
-            
+
         # Filter out cooling entities if cooling is not supported
-        entities = []
-        for description in MODE_SELECTS.values():
-            # Skip cooling entities if cooling is not supported
-            if description.key in SETTING_GROUPS["cooling"].keys:
-                assert coordinator.device is not None, "Coordinator device must not be None"
-                if not coordinator.device.supports_cooling:
-                    continue
-            entities.append(DeWarmteSelectEntity(coordinator, description))
+        supports_cooling = coordinator.device.supports_cooling
+        entities = [
+            DeWarmteSelectEntity(coordinator, description)
+            for description in filtered_descriptions
+            if supports_cooling or description.key not in COOLING_SETTING_KEYS
+        ]
 
         async_add_entities(entities)
 
@@ -183,29 +194,22 @@ class DeWarmteSelectEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Sel
         assert coordinator.device is not None, "Coordinator device must not be None"
         assert description.options is not None, "Select entity must have options"
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device.device_id}_{description.key}"
+        # Settings attribute this entity reads and writes
+        self._setting_key = description.key
+        self._attr_unique_id = coordinator.unique_id_prefix + description.key
         self._attr_device_info = coordinator.device_info
         self._attr_options = description.options
 
-    @property
-    def dewarmte_description(self) -> DeWarmteSelectEntityDescription:
-        """Get the DeWarmte specific entity description."""
-        return cast(DeWarmteSelectEntityDescription, self.entity_description)
-
     @property
     def current_option(self) -> str | None:  # type: ignore[override]
         """Return the current selected option."""
         # Settings are cached in coordinator, read from there
-        if not hasattr(self.coordinator, '_cached_settings') or not self.coordinator._cached_settings:
-            return None
-
-        settings = self.coordinator._cached_settings
-        key = self.dewarmte_description.key
+        settings = getattr(self.coordinator, "_cached_settings", None)
 
         # All settings are now at the root level
-        return getattr(settings, key, None)
+        return getattr(settings, self._setting_key, None)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await self.coordinator.api.async_update_operation_settings(self.coordinator.device, self.dewarmte_description.key, option)
+        await self.coordinator.api.async_update_operation_settings(self.coordinator.device, self._setting_key, option)
         await self.coordinator.async_request_refresh() 
\ No newline at end of file
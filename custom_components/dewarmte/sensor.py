@@ -5,7 +5,6 @@ from dataclasses import dataclass
 from typing import Any, Callable, Optional, TypeVar, cast, final
 from datetime import timedelta, datetime
 from decimal import Decimal
-import asyncio
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -23,6 +22,7 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.integration.sensor import IntegrationSensor
@@ -30,24 +30,22 @@ from homeassistant.helpers.typing import StateType
 
 from . import _LOGGER, DeWarmteDataUpdateCoordinator
 from .const import DOMAIN
+from .descriptions import descriptions_by_device_type
 from .api.models.status_data import StatusData
 
+PARALLEL_UPDATES = 0
+
 # Type variable for sensor values
 SensorValueT = TypeVar('SensorValueT', float, int, str, bool)
 
 @dataclass(frozen=True)
 class DeWarmteSensorEntityDescription(SensorEntityDescription):
-    """Describes DeWarmte sensor entity."""
+    """Describes DeWarmte sensor entity.
 
-    # Required fields
-    key: str  # The key used to access the sensor value in the coordinator data
+    key is the StatusData attribute the sensor reports.
+    """
 
-    # Optional fields with proper type hints
-    device_class: SensorDeviceClass | None = None
-    state_class: SensorStateClass | None = None
-    native_unit_of_measurement: str | None = None
-    device_types: tuple[str, ...] = ("AO", "PT")  # Device types this sensor applies to
-    suggested_display_precision: int | None = None
+    device_types: frozenset[str] = frozenset({"AO", "PT"})  # Device types this sensor applies to
 
 SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
     # Status sensors
@@ -57,7 +55,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        device_types=("AO", "MP"),  # AO/MP-specific: circulation flow for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: circulation flow for space heating
     ),
     DeWarmteSensorEntityDescription(
         key="supply_temperature",
@@ -65,7 +63,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_types=("AO", "MP"),  # AO/MP-specific: heating supply temperature
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heating supply temperature
     ),
     DeWarmteSensorEntityDescription(
         key="outdoor_temperature",
@@ -73,7 +71,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_types=("AO", "MP"),  # AO/MP-specific: outdoor sensor physically connected to device
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: outdoor sensor physically connected to device
     ),
     DeWarmteSensorEntityDescription(
         key="heat_input",
@@ -81,7 +79,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
-        device_types=("AO", "PT", "HC", "MP"),  # Common: heat input for all devices
+        device_types=frozenset({"AO", "PT", "HC", "MP"}),  # Common: heat input for all devices
     ),
     DeWarmteSensorEntityDescription(
         key="actual_temperature",
@@ -89,7 +87,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_types=("AO", "MP"),  # AO/MP-specific: actual heating temperature
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: actual heating temperature
     ),
     DeWarmteSensorEntityDescription(
         key="electricity_consumption",
@@ -97,7 +95,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
-        device_types=("AO", "PT", "HC", "MP"),  # Common: electricity consumption for all
+        device_types=frozenset({"AO", "PT", "HC", "MP"}),  # Common: electricity consumption for all
     ),
     DeWarmteSensorEntityDescription(
         key="heat_output",
@@ -105,7 +103,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
-        device_types=("AO", "PT", "HC", "MP"),  # Common: heat output for all devices
+        device_types=frozenset({"AO", "PT", "HC", "MP"}),  # Common: heat output for all devices
     ),
     DeWarmteSensorEntityDescription(
         key="target_temperature",
@@ -113,7 +111,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_types=("AO", "MP"),  # AO/MP-specific: heating target temperature
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: heating target temperature
     ),
     DeWarmteSensorEntityDescription(
         key="electric_backup_usage",
@@ -121,7 +119,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
-        device_types=("AO", "MP"),  # AO/MP-specific: backup heating for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: backup heating for space heating
     ),
     # Operational status sensors
     DeWarmteSensorEntityDescription(
@@ -130,7 +128,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=None,
         state_class=None,
         native_unit_of_measurement=None,
-        device_types=("AO", "PT", "HC", "MP"),  # Common: fault codes for all devices
+        device_types=frozenset({"AO", "PT", "HC", "MP"}),  # Common: fault codes for all devices
     ),
     # PT device specific sensors (DHW heat pump)
     DeWarmteSensorEntityDescription(
@@ -139,7 +137,7 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_types=("PT", "HC"),  # PT/HC-specific: boiler top temperature
+        device_types=frozenset({"PT", "HC"}),  # PT/HC-specific: boiler top temperature
     ),
     DeWarmteSensorEntityDescription(
         key="bottom_boiler_temp",
@@ -147,41 +145,56 @@ SENSOR_DESCRIPTIONS: tuple[DeWarmteSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_types=("PT", "HC"),  # PT/HC-specific: boiler bottom temperature
+        device_types=frozenset({"PT", "HC"}),  # PT/HC-specific: boiler bottom temperature
     ),
 )
 
+SENSORS_BY_TYPE = descriptions_by_device_type(SENSOR_DESCRIPTIONS)
+
+# Keys of the power sensors that get an energy integration sensor, decided once
+# here instead of reading each entity's unit during setup
+_POWER_SENSOR_KEYS = frozenset(
+    description.key for description in SENSOR_DESCRIPTIONS
+    if description.native_unit_of_measurement == UnitOfPower.KILO_WATT
+)
+
 @final
 class DeWarmteSensor(CoordinatorEntity[DeWarmteDataUpdateCoordinator], SensorEntity):  # type: ignore[override]
     """Representation of a DeWarmte sensor."""
+
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: DeWarmteDataUpdateCoordinator,
         description: DeWarmteSensorEntityDescription,
+        added_listener: Callable[[DeWarmteSensor, str], None] | None = None,
     ) -> None:
-        """Initialize the sensor."""
+        """Initialize the sensor.
+
+        added_listener is called with the sensor and its entity_id once the
+        sensor has been added to Home Assistant.
+        """
         super().__init__(coordinator)
         assert coordinator.device is not None, "Coordinator device must not be None"
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device.device_id}_{description.key}"
+        # StatusData attribute this sensor reports
+        self._data_key = description.key
+        self._added_listener = added_listener
+        self._attr_unique_id = coordinator.unique_id_prefix + description.key
         self._attr_device_info = coordinator.device_info
 
-    @property
-    def dewarmte_description(self) -> DeWarmteSensorEntityDescription:
-        """Get the DeWarmte specific entity description."""
-        return cast(DeWarmteSensorEntityDescription, self.entity_description)
-    
+    async def async_added_to_hass(self) -> None:
+        """Notify the setup listener once the sensor is registered."""
+        await super().async_added_to_hass()
+        if self._added_listener is not None:
+            self._added_listener(self, self.entity_id)
+
     @property
     def native_value(self) -> StateType:  # type: ignore[override]
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        value = getattr(self.coordinator.data, self.dewarmte_description.key, None)
-        if value is None:
-            return None
-        return cast(StateType, value)
+        # getattr also covers the coordinator having no data yet
+        return cast(StateType, getattr(self.coordinator.data, self._data_key, None))
 
 @final
 class DeWarmteEnergyIntegrationSensor(IntegrationSensor):
@@ -192,7 +205,12 @@ class DeWarmteEnergyIntegrationSensor(IntegrationSensor):
     _attr_icon = "mdi:lightning-bolt"
     _attr_has_entity_name = True
 
-    def __init__(self, source_sensor: DeWarmteSensor) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        source_sensor: DeWarmteSensor,
+        source_entity_id: str,
+    ) -> None:
         """Initialize the energy integration sensor."""
         # Get the polling interval from the coordinator 
         if source_sensor.coordinator.update_interval is None:
@@ -200,8 +218,8 @@ class DeWarmteEnergyIntegrationSensor(IntegrationSensor):
         polling_interval = source_sensor.coordinator.update_interval.total_seconds()
         
         super().__init__(
-            source_sensor.hass,
-            source_entity=source_sensor.entity_id,
+            hass,
+            source_entity=source_entity_id,
             name=f"{source_sensor.name} Energy",
             unique_id=f"{source_sensor.unique_id}_energy",
             round_digits=2,
@@ -245,7 +263,7 @@ class DeWarmteCoPSensor(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Sensor
         self._heat_output_sensor = heat_output_sensor
         self._electrical_input_sensor = electrical_input_sensor
         assert coordinator.device is not None, "Coordinator device must not be None"
-        self._attr_unique_id = f"{coordinator.device.device_id}_cop"
+        self._attr_unique_id = coordinator.unique_id_prefix + "cop"
         self._attr_name = "CoP"
         self._attr_device_info = coordinator.device_info
 
@@ -291,58 +309,87 @@ async def async_setup_entry(
 ) -> None:
     """Set up DeWarmte sensors from a config entry."""
     coordinators = hass.data[DOMAIN][entry.entry_id]
+    entity_registry = er.async_get(hass)
 
     # Support both a single coordinator and a list for backward compatibility
     if not isinstance(coordinators, list):
-        coordinators = [coordinators]
+        coordinators = (coordinators,)
 
     for coordinator in coordinators:
-        # Filter sensor descriptions based on device type
-        filtered_descriptions = [
-            description for description in SENSOR_DESCRIPTIONS
-            if coordinator.device.device_type in description.device_types
-        ]
+        # Sensor descriptions for this device type
+        filtered_descriptions = SENSORS_BY_TYPE.get(coordinator.device.device_type, ())
         
-        # Create regular sensors per device with filtered descriptions
-        regular_sensors = [DeWarmteSensor(coordinator, description) for description in filtered_descriptions]
+        # Energy sensors integrate over their source sensor's entity_id, so
+        # each one is created as soon as its power sensor has been added. A
+        # disabled power sensor is never added; its energy sensor uses the
+        # entity_id from the registry instead.
+        source_added = _energy_sensor_adder(hass, coordinator, async_add_entities)
+        regular_sensors: list[DeWarmteSensor] = []
+        disabled_sources: list[tuple[DeWarmteSensor, str]] = []
+        for description in filtered_descriptions:
+            if description.key not in _POWER_SENSOR_KEYS:
+                regular_sensors.append(DeWarmteSensor(coordinator, description))
+                continue
+
+            registry_entry = _registry_entry(
+                entity_registry, coordinator.unique_id_prefix + description.key
+            )
+            if registry_entry is not None and registry_entry.disabled:
+                sensor = DeWarmteSensor(coordinator, description)
+                disabled_sources.append((sensor, registry_entry.entity_id))
+            else:
+                sensor = DeWarmteSensor(coordinator, description, source_added)
+            regular_sensors.append(sensor)
+
         _LOGGER.debug("Adding %d regular sensors for device %s (type: %s)", 
                      len(regular_sensors), 
                      coordinator.device.device_id if coordinator.device else "unknown",
                      coordinator.device.device_type)
         async_add_entities(regular_sensors)
 
-        # Wait for sensors to be registered; arbitrary number of seconds. 
-        await asyncio.sleep(0.7)
+        for sensor, entity_id in disabled_sources:
+            source_added(sensor, entity_id)
 
-        # Then create energy sensors for power sensors per device
-        energy_sensors = []
-        for sensor in regular_sensors:
-            if sensor.native_unit_of_measurement == UnitOfPower.KILO_WATT:
-                _LOGGER.debug("Creating energy sensor for power sensor: %s", sensor.name)
-                energy_sensor = DeWarmteEnergyIntegrationSensor(sensor)
-                energy_sensors.append(energy_sensor)
-        
-        # Add energy sensors
-        if energy_sensors:
-            _LOGGER.debug("Adding %d energy sensors for device %s", len(energy_sensors), coordinator.device.device_id if coordinator.device else "unknown")
-            async_add_entities(energy_sensors)
-
-            # Wait for energy sensors to be registered
-            await asyncio.sleep(0.7)
-
-            # Find heat output and electrical input energy sensors
-            heat_output_sensor = next(
-                (s for s in energy_sensors if s.source_sensor.entity_description.key == "heat_output"),
-                None
-            )
-            electrical_input_sensor = next(
-                (s for s in energy_sensors if s.source_sensor.entity_description.key == "electricity_consumption"),
-                None
+def _registry_entry(
+    entity_registry: er.EntityRegistry, unique_id: str
+) -> er.RegistryEntry | None:
+    """Return the registry entry of a DeWarmte sensor, if it is registered."""
+    entity_id = entity_registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+    return None if entity_id is None else entity_registry.async_get(entity_id)
+
+def _energy_sensor_adder(
+    hass: HomeAssistant,
+    coordinator: DeWarmteDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> Callable[[DeWarmteSensor, str], None]:
+    """Return a listener that adds energy and CoP sensors for a device."""
+    energy_sensors_by_key: dict[str, DeWarmteEnergyIntegrationSensor] = {}
+
+    @callback
+    def _async_source_added(sensor: DeWarmteSensor, source_entity_id: str) -> None:
+        # A re-added source sensor already has its energy sensor
+        if sensor._data_key in energy_sensors_by_key:
+            return
+
+        _LOGGER.debug("Creating energy sensor for power sensor: %s", sensor.name)
+        energy_sensor = DeWarmteEnergyIntegrationSensor(hass, sensor, source_entity_id)
+        energy_sensors_by_key[sensor._data_key] = energy_sensor
+        new_entities: list[SensorEntity] = [energy_sensor]
+
+        # Find heat output and electrical input energy sensors
+        heat_output_sensor = energy_sensors_by_key.get("heat_output")
+        electrical_input_sensor = energy_sensors_by_key.get("electricity_consumption")
+        if (
+            sensor._data_key in ("heat_output", "electricity_consumption")
+            and heat_output_sensor
+            and electrical_input_sensor
+        ):
+            # Create and add CoP sensor
+            _LOGGER.debug("Adding CoP sensor for device %s", coordinator.device.device_id if coordinator.device else "unknown")
+            new_entities.append(
+                DeWarmteCoPSensor(coordinator, heat_output_sensor, electrical_input_sensor)
             )
 
-            if heat_output_sensor and electrical_input_sensor:
-                # Create and add CoP sensor
-                cop_sensor = DeWarmteCoPSensor(coordinator, heat_output_sensor, electrical_input_sensor)
-                _LOGGER.debug("Adding CoP sensor for device %s", coordinator.device.device_id if coordinator.device else "unknown")
-                async_add_entities([cop_sensor])
+        async_add_entities(new_entities)
 
+    return _async_source_added
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, cast, final
+from types import MappingProxyType
+from typing import Any, final, Mapping
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -14,8 +15,11 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DeWarmteDataUpdateCoordinator
 from .const import DOMAIN
+from .descriptions import descriptions_by_device_type
 from .api.models.settings import SETTING_GROUPS
 
+PARALLEL_UPDATES = 1
+
 _LOGGER = logging.getLogger(__name__)
 
 @dataclass(frozen=True)
@@ -23,16 +27,18 @@ class DeWarmteSwitchEntityDescription(SwitchEntityDescription):
     """Class describing DeWarmte switch entities."""
     icon: str | None = None
     translation_key: str | None = None
-    device_types: tuple[str, ...] = ("AO", "PT", "HC")  # Device types this switch applies to
+    device_types: frozenset[str] = frozenset({"AO", "PT", "HC"})  # Device types this switch applies to
 
-SWITCH_DESCRIPTIONS = {
+SWITCH_DESCRIPTIONS: Mapping[str, DeWarmteSwitchEntityDescription] = MappingProxyType({
     "advanced_boost_mode_control": DeWarmteSwitchEntityDescription(
         key="advanced_boost_mode_control",
         name="Boost Mode",
         icon="mdi:rocket-launch",
-        device_types=("AO", "MP"),  # AO/MP-specific: boost mode for space heating
+        device_types=frozenset({"AO", "MP"}),  # AO/MP-specific: boost mode for space heating
     ),
-}
+})
+
+SWITCHES_BY_TYPE = descriptions_by_device_type(SWITCH_DESCRIPTIONS.values())
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -44,20 +50,18 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up DeWarmte switch platform")
 
     if not isinstance(coordinators, list):
-        coordinators = [coordinators]
+        coordinators = (coordinators,)
 
     for coordinator in coordinators:
-        # Filter switch descriptions by device type
-        filtered_descriptions = [
-            description for description in SWITCH_DESCRIPTIONS.values()
-            if coordinator.device.device_type in description.device_types
-        ]
+        # Switch descriptions for this device type
+        filtered_descriptions = SWITCHES_BY_TYPE.get(coordinator.device.device_type, ())
         
+        # Switches are only created once settings have been fetched
+        has_settings = getattr(coordinator, "_cached_settings", None) is not None
         switches = [
             DeWarmteSwitchEntity(coordinator, description)
             for description in filtered_descriptions
-            if hasattr(coordinator, '_cached_settings') and coordinator._cached_settings is not None
-        ]
+        ] if has_settings else []
         
         _LOGGER.debug("Adding %d switches for device %s (type: %s)",
                      len(switches),
@@ -82,32 +86,26 @@ class DeWarmteSwitchEntity(CoordinatorEntity[DeWarmteDataUpdateCoordinator], Swi
         super().__init__(coordinator)
         assert coordinator.device is not None, "Coordinator device must not be None"
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.device.device_id}_{description.key}"
+        # Settings attribute this entity reads and writes
+        self._setting_key = description.key
+        self._attr_unique_id = coordinator.unique_id_prefix + description.key
         self._attr_device_info = coordinator.device_info
 
-    @property
-    def dewarmte_description(self) -> DeWarmteSwitchEntityDescription:
-        """Get the DeWarmte specific entity description."""
-        return cast(DeWarmteSwitchEntityDescription, self.entity_description)
-
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
         # Settings are cached in coordinator, read from there
-        if not hasattr(self.coordinator, '_cached_settings') or not self.coordinator._cached_settings:
-            return None
-
-        settings = self.coordinator._cached_settings
-        return getattr(settings, self.dewarmte_description.key) if settings else None
+        settings = getattr(self.coordinator, "_cached_settings", None)
+        return getattr(settings, self._setting_key, None)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
 
-        await self.coordinator.api.async_update_operation_settings(self.coordinator.device, self.dewarmte_description.key, True)
+        await self.coordinator.api.async_update_operation_settings(self.coordinator.device, self._setting_key, True)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
 
-        await self.coordinator.api.async_update_operation_settings(self.coordinator.device, self.dewarmte_description.key, False)
+        await self.coordinator.api.async_update_operation_settings(self.coordinator.device, self._setting_key, False)
         await self.coordinator.async_request_refresh() 
\ No newline at end of file
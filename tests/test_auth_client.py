@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+import aiohttp
 import pytest
 
 from custom_components.dewarmte.api.auth import (
     DEFAULT_TOKEN_LIFETIME,
     DeWarmteAuth,
+    extract_access_token,
 )
 from custom_components.dewarmte.api.client import DeWarmteApiClient
 from custom_components.dewarmte.api.models.config import ConnectionSettings
 from custom_components.dewarmte.api.models.device import Device
+from custom_components.dewarmte.api.models.settings import WarmWaterRange
 
 
 class DummySession:
@@ -43,13 +48,22 @@ def test_needs_refresh_logic() -> None:
 class FakeResponse:
     """A fake aiohttp response supporting async context management."""
 
-    def __init__(self, status: int, payload: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        status: int,
+        payload: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
         self.status = status
         self._payload = payload or {}
+        self.headers = headers or {}
 
-    async def json(self) -> Dict[str, Any]:
+    async def json(self) -> Any:
         return self._payload
 
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
     async def text(self) -> str:
         return str(self._payload)
 
@@ -66,16 +80,23 @@ class FakeSession:
     def __init__(self, responses: List[FakeResponse]) -> None:
         self._responses = responses
         self.get_calls: List[str] = []
+        self.get_headers: List[Dict[str, str]] = []
+        self.post_calls: List[tuple[str, Any]] = []
 
     def get(self, url: str, *, headers: Optional[Dict[str, str]] = None) -> FakeResponse:
         self.get_calls.append(url)
+        self.get_headers.append(headers or {})
         if not self._responses:
             raise AssertionError("No responses left for GET")
         return self._responses.pop(0)
 
-    # login path may attempt to post; delegate to DummySession behaviour if needed
-    def post(self, *args: Any, **kwargs: Any) -> Any:  # pragma: no cover - not used
-        raise RuntimeError("Network POST not expected in FakeSession")
+    def post(
+        self, url: str, *, headers: Optional[Dict[str, str]] = None, data: Any = None
+    ) -> FakeResponse:
+        self.post_calls.append((url, data))
+        if not self._responses:
+            raise AssertionError("No responses left for POST")
+        return self._responses.pop(0)
 
 
 class StubAuth:
@@ -185,3 +206,201 @@ async def test_async_get_status_data_refreshes_before_expiry() -> None:
     assert session.get_calls[0].endswith("/customer/products/")
     assert len(session.get_calls) == 2  # product + tb-status
 
+
+
+def test_extract_access_token() -> None:
+    """Only the access token should be taken from the login response."""
+    body = b'{"refresh": "r-token", "access": "a-token", "user": {"id": 1}}'
+    assert extract_access_token(body) == "a-token"
+
+    # Escaped values fall back to a full JSON parse
+    assert extract_access_token(b'{"access": "a\\"b"}') == 'a"b'
+
+    assert extract_access_token(b'{"refresh": "r-token"}') is None
+    assert extract_access_token(b"not json") is None
+
+
+@pytest.mark.asyncio
+async def test_async_get_status_data_unknown_device() -> None:
+    """Status fetch should return None when the device is not in the products list."""
+    session = FakeSession(
+        [
+            FakeResponse(200, {"results": [{"id": "device-1", "status": {}}]}),
+            FakeResponse(200, {"outdoor_temperature": 12}),
+        ]
+    )
+    client = DeWarmteApiClient(
+        ConnectionSettings(username="user", password="pass", update_interval=60),
+        session,
+    )
+    client._auth = StubAuth()  # type: ignore[attr-defined]
+
+    device = Device(
+        device_id="device-2",
+        product_id="AO Test",
+        access_token="token",
+        device_type="AO",
+    )
+
+    assert await client.async_get_status_data(device) is None
+
+
+@pytest.mark.asyncio
+async def test_update_operation_settings_unknown_key() -> None:
+    """Updating a setting outside every settings group should raise before any request."""
+    session = FakeSession([])
+    client = DeWarmteApiClient(
+        ConnectionSettings(username="user", password="pass", update_interval=60),
+        session,
+    )
+    client._auth = StubAuth()  # type: ignore[attr-defined]
+
+    device = Device(
+        device_id="device-1",
+        product_id="AO Test",
+        access_token="token",
+        device_type="AO",
+    )
+
+    with pytest.raises(ValueError):
+        await client.async_update_operation_settings(device, "not_a_setting", 1)
+
+
+@pytest.mark.asyncio
+async def test_get_with_retry_reuses_body_on_not_modified() -> None:
+    """A 304 reply to a conditional GET should return the previously decoded body."""
+    payload = {"results": [{"id": "device-1"}]}
+    session = FakeSession(
+        [
+            FakeResponse(200, payload, headers={"ETag": '"v1"'}),
+            FakeResponse(304),
+        ]
+    )
+    client = DeWarmteApiClient(
+        ConnectionSettings(username="user", password="pass", update_interval=60),
+        session,
+    )
+    client._auth = StubAuth()  # type: ignore[attr-defined]
+
+    assert await client._get_with_retry("https://example/products/") == payload
+    assert await client._get_with_retry("https://example/products/") == payload
+
+    assert "If-None-Match" not in session.get_headers[0]
+    assert session.get_headers[1]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client_pauses_requests() -> None:
+    """After a 429 the client should not send requests until Retry-After has passed."""
+    session = FakeSession([FakeResponse(429, headers={"Retry-After": "120"})])
+    client = DeWarmteApiClient(
+        ConnectionSettings(username="user", password="pass", update_interval=60),
+        session,
+    )
+    client._auth = StubAuth()  # type: ignore[attr-defined]
+
+    assert await client._get_with_retry("https://example/products/") is None
+    assert await client._get_with_retry("https://example/products/") is None
+
+    assert len(session.get_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_warm_water_ranges_posts_once() -> None:
+    """Warm water ranges should be replaced with a single POST to the warm water endpoint."""
+    session = FakeSession([FakeResponse(200, {})])
+    client = DeWarmteApiClient(
+        ConnectionSettings(username="user", password="pass", update_interval=60),
+        session,
+    )
+    client._auth = StubAuth()  # type: ignore[attr-defined]
+
+    device = Device(
+        device_id="device-1",
+        product_id="PT Test",
+        access_token="token",
+        device_type="PT",
+    )
+
+    await client.async_update_warm_water_ranges(
+        device, [WarmWaterRange(order=0, temperature=50.0, period="00:00-00:00")]
+    )
+
+    assert len(session.post_calls) == 1
+    url, data = session.post_calls[0]
+    assert url == f"{client.settings_url(device)}warm-water/"
+    assert json.loads(data) == {
+        "warm_water_is_scheduled": True,
+        "warm_water_ranges": [{"order": 0, "temperature": 50.0, "period": "00:00-00:00"}],
+    }
+
+
+class FailingSession:
+    """Session whose requests fail with a connection error."""
+
+    def post(self, *args: Any, **kwargs: Any) -> Any:
+        raise aiohttp.ClientConnectionError("unreachable")
+
+
+@pytest.mark.asyncio
+async def test_validate_credentials_separates_connection_errors() -> None:
+    """Rejected credentials return False while connection errors propagate."""
+    settings = ConnectionSettings(username="user", password="pass", update_interval=60)
+
+    rejected = DeWarmteApiClient(settings, FakeSession([FakeResponse(401, {})]))
+    assert await rejected.async_validate_credentials() is False
+
+    unreachable = DeWarmteApiClient(settings, FailingSession())
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await unreachable.async_validate_credentials()
+    # Regular token refreshes still swallow the error
+    assert await unreachable._auth.ensure_token() is False
+
+
+class SlowResponse(FakeResponse):
+    """A fake response that yields to the event loop before it is entered."""
+
+    async def __aenter__(self) -> "FakeResponse":
+        await asyncio.sleep(0)
+        return self
+
+
+@pytest.mark.asyncio
+async def test_concurrent_ensure_token_logs_in_once() -> None:
+    """Concurrent callers needing a token should share a single login request."""
+    session = FakeSession([SlowResponse(200, {"access": "token"})])
+    auth = DeWarmteAuth("user", "pass", session)  # type: ignore[arg-type]
+
+    results = await asyncio.gather(auth.ensure_token(), auth.ensure_token())
+
+    assert results == [True, True]
+    assert len(session.post_calls) == 1
+    assert auth.access_token == "token"
+
+
+@pytest.mark.asyncio
+async def test_non_object_body_is_treated_as_failure() -> None:
+    """A JSON list body should not escape discovery or the status fetch."""
+    error_body = ["Service temporarily unavailable"]
+    session = FakeSession(
+        [
+            FakeResponse(200, error_body),
+            FakeResponse(200, error_body),
+            FakeResponse(200, {"outdoor_temperature": 12}),
+        ]
+    )
+    client = DeWarmteApiClient(
+        ConnectionSettings(username="user", password="pass", update_interval=60),
+        session,
+    )
+    client._auth = StubAuth()  # type: ignore[attr-defined]
+
+    assert await client.async_discover_devices() == []
+
+    device = Device(
+        device_id="device-1",
+        product_id="AO Test",
+        access_token="token",
+        device_type="AO",
+    )
+    assert await client.async_get_status_data(device) is None
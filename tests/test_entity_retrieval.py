@@ -17,7 +17,7 @@ async def main():
             
             print(f"✓ Found {len(devices)} device(s):")
             for device in devices:
-                print(f"  - {device.device_id} (Product ID: {device.product_id}, Type: {device.product_id.split()[0]})")
+                print(f"  - {device.device_id} (Product ID: {device.product_id}, Type: {device.device_type})")
 
             # Test each device
             for device in devices:
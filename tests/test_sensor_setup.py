@@ -0,0 +1,108 @@
+"""Unit tests for energy and CoP sensor creation during sensor setup."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.dewarmte import sensor as sensor_platform
+from custom_components.dewarmte.const import DOMAIN
+
+
+class FakeRegistry:
+    """Entity registry holding a fixed set of DeWarmte sensors."""
+
+    def __init__(self, entries: Dict[str, SimpleNamespace]) -> None:
+        self._by_unique_id = entries
+        self._by_entity_id = {entry.entity_id: entry for entry in entries.values()}
+
+    def async_get_entity_id(self, domain: str, platform: str, unique_id: str) -> Optional[str]:
+        assert (domain, platform) == ("sensor", DOMAIN)
+        entry = self._by_unique_id.get(unique_id)
+        return None if entry is None else entry.entity_id
+
+    def async_get(self, entity_id: str) -> Optional[SimpleNamespace]:
+        return self._by_entity_id.get(entity_id)
+
+
+class FakeEnergySensor:
+    """Records the source an energy sensor was created for."""
+
+    def __init__(self, hass: Any, source_sensor: Any, source_entity_id: str) -> None:
+        self.source_sensor = source_sensor
+        self.source_entity_id = source_entity_id
+
+
+class FakeCoPSensor:
+    """Records the energy sensors a CoP sensor was created from."""
+
+    def __init__(self, coordinator: Any, heat_output_sensor: Any, electrical_input_sensor: Any) -> None:
+        self.heat_output_sensor = heat_output_sensor
+        self.electrical_input_sensor = electrical_input_sensor
+
+
+@pytest.mark.asyncio
+async def test_energy_sensors_for_enabled_and_disabled_power_sensors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Disabled power sensors get their energy sensor at setup, enabled ones once added."""
+    registry = FakeRegistry({
+        "device-1_heat_output": SimpleNamespace(
+            entity_id="sensor.dewarmte_heat_output", disabled=True
+        ),
+        "device-1_electricity_consumption": SimpleNamespace(
+            entity_id="sensor.dewarmte_electricity_consumption", disabled=False
+        ),
+    })
+    monkeypatch.setattr(sensor_platform.er, "async_get", lambda hass: registry)
+    monkeypatch.setattr(sensor_platform, "DeWarmteEnergyIntegrationSensor", FakeEnergySensor)
+    monkeypatch.setattr(sensor_platform, "DeWarmteCoPSensor", FakeCoPSensor)
+    monkeypatch.setattr(CoordinatorEntity, "async_added_to_hass", AsyncMock())
+
+    coordinator = MagicMock()
+    coordinator.device = SimpleNamespace(device_id="device-1", device_type="PT")
+    coordinator.unique_id_prefix = "device-1_"
+    coordinator.update_interval = timedelta(seconds=60)
+    entry = SimpleNamespace(entry_id="entry-1")
+    hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: [coordinator]}})
+
+    added: List[List[Any]] = []
+    await sensor_platform.async_setup_entry(hass, entry, added.append)  # type: ignore[arg-type]
+
+    regular_sensors = {sensor._data_key: sensor for sensor in added[0]}
+    assert {"heat_input", "electricity_consumption", "heat_output"} <= set(regular_sensors)
+
+    # The disabled heat output sensor is never added, so its energy sensor is
+    # created right away from the registry entity_id
+    assert len(added) == 2
+    (energy_sensor,) = added[1]
+    assert energy_sensor.source_sensor is regular_sensors["heat_output"]
+    assert energy_sensor.source_entity_id == "sensor.dewarmte_heat_output"
+
+    # Enabled power sensors get theirs once they have been added
+    electricity = regular_sensors["electricity_consumption"]
+    electricity.entity_id = "sensor.dewarmte_electricity_consumption"
+    await electricity.async_added_to_hass()
+    energy_sensor, cop_sensor = added[2]
+    assert energy_sensor.source_entity_id == "sensor.dewarmte_electricity_consumption"
+    assert isinstance(cop_sensor, FakeCoPSensor)
+    assert cop_sensor.heat_output_sensor.source_sensor is regular_sensors["heat_output"]
+    assert cop_sensor.electrical_input_sensor is energy_sensor
+
+    heat_input = regular_sensors["heat_input"]
+    heat_input.entity_id = "sensor.dewarmte_heat_input"
+    await heat_input.async_added_to_hass()
+    (energy_sensor,) = added[3]
+    assert energy_sensor.source_entity_id == "sensor.dewarmte_heat_input"
+
+    # A re-added source sensor does not get a second energy sensor
+    await heat_input.async_added_to_hass()
+    assert len(added) == 4
@@ -11,9 +11,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from custom_components.dewarmte.select import MODE_SELECTS
 from custom_components.dewarmte.switch import SWITCH_DESCRIPTIONS
-from custom_components.dewarmte.number import TEMPERATURE_NUMBERS
+from custom_components.dewarmte.number import NUMBER_DESCRIPTIONS
 from test_base import TestBase
 
+# The platforms keep their descriptions as tuples; index them by key here
+SELECTS_BY_KEY = {description.key: description for description in MODE_SELECTS}
+NUMBERS_BY_KEY = {description.key: description for description in NUMBER_DESCRIPTIONS}
+
 async def main() -> None:
     """Run the script."""
     parser = argparse.ArgumentParser(description="Test the update functionality of api.py")
@@ -36,13 +40,13 @@ async def main() -> None:
                 print(f"Invalid switch entity: {setting_name}")
                 print(f"Available switch entities: {', '.join(SWITCH_DESCRIPTIONS.keys())}")
                 sys.exit(1)
-            elif entity_type == "select" and setting_name not in MODE_SELECTS:
+            elif entity_type == "select" and setting_name not in SELECTS_BY_KEY:
                 print(f"Invalid select entity: {setting_name}")
-                print(f"Available select entities: {', '.join(MODE_SELECTS.keys())}")
+                print(f"Available select entities: {', '.join(SELECTS_BY_KEY)}")
                 sys.exit(1)
-            elif entity_type == "number" and setting_name not in TEMPERATURE_NUMBERS:
+            elif entity_type == "number" and setting_name not in NUMBERS_BY_KEY:
                 print(f"Invalid number entity: {setting_name}")
-                print(f"Available number entities: {', '.join(TEMPERATURE_NUMBERS.keys())}")
+                print(f"Available number entities: {', '.join(NUMBERS_BY_KEY)}")
                 sys.exit(1)
 
             # Validate and convert the value
@@ -53,7 +57,7 @@ async def main() -> None:
                         sys.exit(1)
                     value = args.new_state.lower() == "on"
                 elif entity_type == "select":
-                    valid_options = MODE_SELECTS[setting_name].options
+                    valid_options = SELECTS_BY_KEY[setting_name].options
                     if args.new_state not in valid_options:
                         print(f"Invalid option for {setting_name}")
                         print(f"Available options: {', '.join(valid_options)}")
@@ -61,8 +65,8 @@ async def main() -> None:
                     value = args.new_state
                 else:  # number
                     value = float(args.new_state)
-                    # Get min/max values from TEMPERATURE_NUMBERS if available
-                    entity_desc = TEMPERATURE_NUMBERS[setting_name]
+                    # Get min/max values from NUMBER_DESCRIPTIONS if available
+                    entity_desc = NUMBERS_BY_KEY[setting_name]
                     if hasattr(entity_desc, "native_min_value") and value < entity_desc.native_min_value:
                         print(f"Value {value} is below minimum {entity_desc.native_min_value}")
                         sys.exit(1)